@@ -2,12 +2,17 @@
 """
 Script to add complete English and French translations for Opulanzbanking
 """
-import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from build_prices import format_price
+from catalog_history import record_snapshot
+from i18n_common import CatalogConflict, load_catalog_stamped, save_catalog
 
 def add_english_translations():
     """Add all English translation keys"""
-    with open('messages/en.json', 'r', encoding='utf-8') as f:
-        en = json.load(f)
+    en, en_sha1 = load_catalog_stamped('en')
 
     # Investment Advisory - Complete translations
     en['investmentAdvisory'] = {
@@ -427,41 +432,39 @@ def add_english_translations():
             'taxReturn': {
                 'title': 'Tax Return Preparation',
                 'description': 'Professional preparation and filing of corporate and individual tax returns across multiple jurisdictions.',
-                'price': '€299'
+                'price': format_price('en', 'tax-advisory/tax-return-preparation')
             },
             'international': {
                 'title': 'International Tax',
                 'description': 'Expert guidance on cross-border tax matters, transfer pricing, and double taxation treaties.',
-                'price': '€250'
+                'price': format_price('en', 'tax-advisory/international-tax')
             },
             'corporate': {
                 'title': 'Corporate Tax',
                 'description': 'Comprehensive corporate tax services including restructuring, M&A tax advice, and VAT consulting.',
-                'price': '€150'
+                'price': format_price('en', 'tax-advisory/corporate-tax')
             },
             'compliance': {
                 'title': 'Tax Compliance',
                 'description': 'Ensure ongoing compliance with changing tax laws and regulations in Luxembourg and beyond.',
-                'price': '€250'
+                'price': format_price('en', 'tax-advisory/tax-compliance')
             },
             'personal': {
                 'title': 'Personal Tax Advisory',
                 'description': 'Personalized tax advice for high-net-worth individuals and expatriates.',
-                'price': '€100'
+                'price': format_price('en', 'tax-advisory/personal-tax-advisory')
             }
         }
     }
 
-    with open('messages/en.json', 'w', encoding='utf-8') as f:
-        json.dump(en, f, indent=2, ensure_ascii=False)
+    save_catalog('en', en, message='add_translations.py', expected_sha1=en_sha1)
 
     print("✅ English translations added successfully")
     return en
 
 def add_french_translations():
     """Add all French translations"""
-    with open('messages/fr.json', 'r', encoding='utf-8') as f:
-        fr = json.load(f)
+    fr, fr_sha1 = load_catalog_stamped('fr')
 
     # Investment Advisory - French translations
     fr['investmentAdvisory'] = {
@@ -881,48 +884,60 @@ def add_french_translations():
             'taxReturn': {
                 'title': 'Préparation des Déclarations Fiscales',
                 'description': 'Préparation et dépôt professionnels des déclarations fiscales d\'entreprise et individuelles dans plusieurs juridictions.',
-                'price': '€299'
+                'price': format_price('fr', 'tax-advisory/tax-return-preparation')
             },
             'international': {
                 'title': 'Fiscalité Internationale',
                 'description': 'Conseils experts sur les questions fiscales transfrontalières, les prix de transfert et les conventions de double imposition.',
-                'price': '€250'
+                'price': format_price('fr', 'tax-advisory/international-tax')
             },
             'corporate': {
                 'title': 'Fiscalité d\'Entreprise',
                 'description': 'Services fiscaux d\'entreprise complets incluant la restructuration, les conseils fiscaux en fusions-acquisitions et le conseil en TVA.',
-                'price': '€150'
+                'price': format_price('fr', 'tax-advisory/corporate-tax')
             },
             'compliance': {
                 'title': 'Conformité Fiscale',
                 'description': 'Assurer une conformité continue avec l\'évolution des lois et réglementations fiscales au Luxembourg et au-delà.',
-                'price': '€250'
+                'price': format_price('fr', 'tax-advisory/tax-compliance')
             },
             'personal': {
                 'title': 'Conseil Fiscal Personnel',
                 'description': 'Conseils fiscaux personnalisés pour les particuliers fortunés et les expatriés.',
-                'price': '€100'
+                'price': format_price('fr', 'tax-advisory/personal-tax-advisory')
             }
         }
     }
 
-    with open('messages/fr.json', 'w', encoding='utf-8') as f:
-        json.dump(fr, f, indent=2, ensure_ascii=False)
+    save_catalog('fr', fr, message='add_translations.py', expected_sha1=fr_sha1)
 
     print("✅ French translations added successfully")
     return fr
 
+def run_with_retry(update, retries=5):
+    """Re-run an update from a fresh read if another writer got in first"""
+    for attempt in range(retries):
+        try:
+            return update()
+        except CatalogConflict as e:
+            print(f"⚠️  {e}, retrying ({attempt + 1}/{retries})...")
+    raise CatalogConflict(f"giving up after {retries} conflicting writes")
+
 if __name__ == '__main__':
     print("🚀 Starting translation update...")
     print()
 
-    en = add_english_translations()
+    # Each catalog write is its own snapshot; this one is the whole run's rollback point
+    rollback = record_snapshot('before add_translations.py')
+
+    en = run_with_retry(add_english_translations)
     print(f"   English keys: {len(en)}")
     print()
 
-    fr = add_french_translations()
+    fr = run_with_retry(add_french_translations)
     print(f"   French keys: {len(fr)}")
     print()
 
     print("✅ All translations updated successfully!")
     print(f"   Total translation keys added: ~350+")
+    print(f"   Undo this run with `python3 scripts/catalog_history.py restore {rollback[:10]}`")
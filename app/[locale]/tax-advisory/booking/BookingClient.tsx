@@ -12,6 +12,7 @@ import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
 import { Label } from "@/components/ui/label";
 import Script from "next/script";
+import { formatPrice, formatPriceBreakdown, isPriceId, prices, type PriceId } from "@/i18n/prices.generated";
 
 interface BookingData {
   // Customer info
@@ -53,35 +54,35 @@ export default function BookingClient({ params: { locale } }: { params: { locale
       icon: FileCheck,
       title: t("services.taxReturnPreparation.title"),
       description: t("services.taxReturnPreparation.description"),
-      price: 299,
+      price: prices["tax-advisory/tax-return-preparation"].amount,
     },
     {
       id: "international-tax",
       icon: Globe,
       title: t("services.internationalTax.title"),
       description: t("services.internationalTax.description"),
-      price: 250,
+      price: prices["tax-advisory/international-tax"].amount,
     },
     {
       id: "corporate-tax",
       icon: Briefcase,
       title: t("services.corporateTax.title"),
       description: t("services.corporateTax.description"),
-      price: 150,
+      price: prices["tax-advisory/corporate-tax"].amount,
     },
     {
       id: "tax-compliance",
       icon: Shield,
       title: t("services.taxCompliance.title"),
       description: t("services.taxCompliance.description"),
-      price: 250,
+      price: prices["tax-advisory/tax-compliance"].amount,
     },
     {
       id: "personal-tax-advisory",
       icon: UserCheck,
       title: t("services.personalTaxAdvisory.title"),
       description: t("services.personalTaxAdvisory.description"),
-      price: 100,
+      price: prices["tax-advisory/personal-tax-advisory"].amount,
     },
   ];
 
@@ -278,6 +279,12 @@ export default function BookingClient({ params: { locale } }: { params: { locale
     }
   };
 
+  // Formatted prices of the selected service (see i18n/prices.json)
+  const selectedPriceId = `tax-advisory/${bookingData.serviceId}`;
+  const selectedPrice = isPriceId(selectedPriceId)
+    ? { label: formatPrice(locale, selectedPriceId), ...formatPriceBreakdown(locale, selectedPriceId) }
+    : null;
+
   // STEP 1: Customer Information
   if (step === "info") {
     return (
@@ -440,7 +447,7 @@ export default function BookingClient({ params: { locale } }: { params: { locale
                 <div className="flex items-center justify-center gap-3">
                   <CheckCircle className="h-5 w-5 text-brand-gold" />
                   <p className="text-brand-dark font-semibold">
-                    {bookingData.serviceTitle} (€{bookingData.servicePrice})
+                    {bookingData.serviceTitle} ({selectedPrice?.label})
                   </p>
                 </div>
               </div>
@@ -513,7 +520,7 @@ export default function BookingClient({ params: { locale } }: { params: { locale
                       </div>
                       <CardTitle className="text-xl">{service.title}</CardTitle>
                       <div className="mt-2">
-                        <span className="text-2xl font-bold text-brand-gold">€{service.price}</span>
+                        <span className="text-2xl font-bold text-brand-gold">{formatPrice(locale, `tax-advisory/${service.id}` as PriceId)}</span>
                       </div>
                     </CardHeader>
                     <CardContent>
@@ -635,20 +642,20 @@ export default function BookingClient({ params: { locale } }: { params: { locale
                     <div className="flex justify-between items-center text-lg mb-2">
                       <span className="text-brand-grayMed">{t("step4.serviceFeeExclVAT")}</span>
                       <span className="font-semibold text-brand-dark">
-                        €{((bookingData.servicePrice || 0) / 1.17).toFixed(2)}
+                        {selectedPrice?.net}
                       </span>
                     </div>
                     <div className="flex justify-between items-center text-lg mb-2">
                       <span className="text-brand-grayMed">{t("step4.vat")}</span>
                       <span className="font-semibold text-brand-dark">
-                        €{((bookingData.servicePrice || 0) - ((bookingData.servicePrice || 0) / 1.17)).toFixed(2)}
+                        {selectedPrice?.vat}
                       </span>
                     </div>
                     <div className="border-t border-brand-grayLight pt-4 mt-4">
                       <div className="flex justify-between items-center">
                         <span className="text-xl font-bold text-brand-dark">{t("step4.totalInclVAT")}</span>
                         <span className="text-3xl font-bold text-brand-gold">
-                          €{(bookingData.servicePrice || 0).toFixed(2)}
+                          {selectedPrice?.total}
                         </span>
                       </div>
                     </div>
@@ -753,7 +760,7 @@ export default function BookingClient({ params: { locale } }: { params: { locale
                   </div>
                   <div className="flex justify-between text-xl font-bold border-t pt-3">
                     <span className="text-brand-dark">{t("payment.total")}</span>
-                    <span className="text-brand-gold">€{(bookingData.servicePrice || 0).toFixed(2)}</span>
+                    <span className="text-brand-gold">{selectedPrice?.total}</span>
                   </div>
                 </div>
 
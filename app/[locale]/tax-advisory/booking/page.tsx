@@ -11,6 +11,7 @@ import { Input } from "@/components/ui/input";
 import { Label } from "@/components/ui/label";
 import Script from "next/script";
 import { SearchParamsWrapper } from "@/components/search-params-wrapper";
+import { formatPrice, formatPriceBreakdown, isPriceId, prices, type PriceId } from "@/i18n/prices.generated";
 
 // Force dynamic rendering to avoid prerendering issues with useSearchParams
 export const dynamic = 'force-dynamic';
@@ -62,35 +63,35 @@ function TaxAdvisoryBookingPageContent({ locale }: { locale: string }) {
       icon: FileCheck,
       title: tReturn('hero.title'),
       description: tReturn('hero.subtitle'),
-      price: 299,
+      price: prices["tax-advisory/tax-return-preparation"].amount,
     },
     {
       id: "international-tax",
       icon: Globe,
       title: tInternational('hero.title'),
       description: tInternational('hero.subtitle'),
-      price: 250,
+      price: prices["tax-advisory/international-tax"].amount,
     },
     {
       id: "corporate-tax",
       icon: Briefcase,
       title: tCorporate('hero.title'),
       description: tCorporate('hero.subtitle'),
-      price: 150,
+      price: prices["tax-advisory/corporate-tax"].amount,
     },
     {
       id: "tax-compliance",
       icon: Shield,
       title: tCompliance('hero.title'),
       description: tCompliance('hero.subtitle'),
-      price: 250,
+      price: prices["tax-advisory/tax-compliance"].amount,
     },
     {
       id: "personal-tax-advisory",
       icon: UserCheck,
       title: tPersonal('hero.title'),
       description: tPersonal('hero.subtitle'),
-      price: 100,
+      price: prices["tax-advisory/personal-tax-advisory"].amount,
     },
   ];
 
@@ -287,6 +288,12 @@ function TaxAdvisoryBookingPageContent({ locale }: { locale: string }) {
     }
   };
 
+  // Formatted prices of the selected service (see i18n/prices.json)
+  const selectedPriceId = `tax-advisory/${bookingData.serviceId}`;
+  const selectedPrice = isPriceId(selectedPriceId)
+    ? { label: formatPrice(locale, selectedPriceId), ...formatPriceBreakdown(locale, selectedPriceId) }
+    : null;
+
   // STEP 1: Customer Information
   if (step === "info") {
     return (
@@ -449,7 +456,7 @@ function TaxAdvisoryBookingPageContent({ locale }: { locale: string }) {
                 <div className="flex items-center justify-center gap-3">
                   <CheckCircle className="h-5 w-5 text-brand-gold" />
                   <p className="text-brand-dark font-semibold">
-                    Selected Service: {bookingData.serviceTitle} (€{bookingData.servicePrice})
+                    Selected Service: {bookingData.serviceTitle} ({selectedPrice?.label})
                   </p>
                 </div>
               </div>
@@ -522,7 +529,7 @@ function TaxAdvisoryBookingPageContent({ locale }: { locale: string }) {
                       </div>
                       <CardTitle className="text-xl">{service.title}</CardTitle>
                       <div className="mt-2">
-                        <span className="text-2xl font-bold text-brand-gold">€{service.price}</span>
+                        <span className="text-2xl font-bold text-brand-gold">{formatPrice(locale, `tax-advisory/${service.id}` as PriceId)}</span>
                       </div>
                     </CardHeader>
                     <CardContent>
@@ -645,20 +652,20 @@ function TaxAdvisoryBookingPageContent({ locale }: { locale: string }) {
                     <div className="flex justify-between items-center text-lg mb-2">
                       <span className="text-brand-grayMed">{tCommon('payment.serviceFeeExcl')}</span>
                       <span className="font-semibold text-brand-dark">
-                        €{((bookingData.servicePrice || 0) / 1.17).toFixed(2)}
+                        {selectedPrice?.net}
                       </span>
                     </div>
                     <div className="flex justify-between items-center text-lg mb-2">
                       <span className="text-brand-grayMed">{tCommon('payment.vat17')}</span>
                       <span className="font-semibold text-brand-dark">
-                        €{((bookingData.servicePrice || 0) - ((bookingData.servicePrice || 0) / 1.17)).toFixed(2)}
+                        {selectedPrice?.vat}
                       </span>
                     </div>
                     <div className="border-t border-brand-grayLight pt-4 mt-4">
                       <div className="flex justify-between items-center">
                         <span className="text-xl font-bold text-brand-dark">{tCommon('payment.totalIncl')}</span>
                         <span className="text-3xl font-bold text-brand-gold">
-                          €{(bookingData.servicePrice || 0).toFixed(2)}
+                          {selectedPrice?.total}
                         </span>
                       </div>
                     </div>
@@ -764,7 +771,7 @@ function TaxAdvisoryBookingPageContent({ locale }: { locale: string }) {
                   </div>
                   <div className="flex justify-between text-xl font-bold border-t pt-3">
                     <span className="text-brand-dark">Total:</span>
-                    <span className="text-brand-gold">€{(bookingData.servicePrice || 0).toFixed(2)}</span>
+                    <span className="text-brand-gold">{selectedPrice?.total}</span>
                   </div>
                 </div>
 
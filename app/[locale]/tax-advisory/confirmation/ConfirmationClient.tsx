@@ -6,6 +6,7 @@ import { useTranslations } from "next-intl";
 import { CheckCircle, Calendar, Clock, Mail, User, FileText, Download, ArrowRight } from "lucide-react";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
+import { formatPriceBreakdown, isPriceId } from "@/i18n/prices.generated";
 
 export const dynamic = 'force-dynamic';
 
@@ -62,6 +63,12 @@ export default function ConfirmationClient({ params: { locale } }: { params: { l
   // Generate confirmation number if not provided
   const confirmationNumber = bookingData.confirmationNumber || `TAX-${Date.now().toString(36).toUpperCase()}`;
 
+  // Prices come from the price table (i18n/prices.json) via the booked service
+  const priceId = `tax-advisory/${bookingData.service}`;
+  const price = isPriceId(priceId) ? formatPriceBreakdown(locale, priceId) : null;
+  // The downloadable receipt is written in English
+  const receiptPrice = isPriceId(priceId) ? formatPriceBreakdown("en", priceId) : null;
+
   // Format date
   const formattedDate = React.useMemo(() => {
     if (!bookingData.date) return null;
@@ -278,17 +285,17 @@ export default function ConfirmationClient({ params: { locale } }: { params: { l
     </div>
     <div class="detail-row">
       <span class="detail-label">Service Fee (excl. VAT):</span>
-      <span class="detail-value">€${(parseFloat(bookingData.price || '0') / 1.17).toFixed(2)}</span>
+      <span class="detail-value">${receiptPrice?.net ?? ''}</span>
     </div>
     <div class="detail-row">
       <span class="detail-label">VAT (17%):</span>
-      <span class="detail-value">€${(parseFloat(bookingData.price || '0') - (parseFloat(bookingData.price || '0') / 1.17)).toFixed(2)}</span>
+      <span class="detail-value">${receiptPrice?.vat ?? ''}</span>
     </div>
   </div>
 
   <div class="total-row detail-row">
     <span class="total-label">TOTAL (incl. VAT):</span>
-    <span class="total-value">€${parseFloat(bookingData.price || '0').toFixed(2)}</span>
+    <span class="total-value">${receiptPrice?.total ?? ''}</span>
   </div>
 
   <div class="section">
@@ -499,7 +506,7 @@ export default function ConfirmationClient({ params: { locale } }: { params: { l
                     <p className="text-sm text-brand-grayMed">{t("consultation", { minutes: 60 })}</p>
                   </div>
                   <div className="text-right">
-                    <p className="text-2xl font-bold text-brand-gold">€{bookingData.price}.00</p>
+                    <p className="text-2xl font-bold text-brand-gold">{price?.total}</p>
                     <p className="text-xs text-brand-grayMed">{t("inclVAT")}</p>
                   </div>
                 </div>
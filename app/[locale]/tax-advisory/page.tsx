@@ -8,6 +8,7 @@ import { Hero } from "@/components/hero";
 import { SectionHeading } from "@/components/section-heading";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
+import { formatPrice, prices } from "@/i18n/prices.generated";
 
 export default function TaxAdvisoryPage({ params: { locale } }: { params: { locale: string } }) {
   const t = useTranslations();
@@ -20,8 +21,8 @@ export default function TaxAdvisoryPage({ params: { locale } }: { params: { loca
       title: tTax('services.taxReturn.title'),
       description: tTax('services.taxReturn.description'),
       href: `/${locale}/tax-advisory/booking?service=tax-return-preparation`,
-      price: "€299",
-      priceValue: 299,
+      price: formatPrice(locale, "tax-advisory/tax-return-preparation"),
+      priceValue: prices["tax-advisory/tax-return-preparation"].amount,
     },
     {
       id: "international-tax",
@@ -29,8 +30,8 @@ export default function TaxAdvisoryPage({ params: { locale } }: { params: { loca
       title: tTax('services.international.title'),
       description: tTax('services.international.description'),
       href: `/${locale}/tax-advisory/booking?service=international-tax`,
-      price: "€250",
-      priceValue: 250,
+      price: formatPrice(locale, "tax-advisory/international-tax"),
+      priceValue: prices["tax-advisory/international-tax"].amount,
     },
     {
       id: "corporate-tax",
@@ -38,8 +39,8 @@ export default function TaxAdvisoryPage({ params: { locale } }: { params: { loca
       title: tTax('services.corporate.title'),
       description: tTax('services.corporate.description'),
       href: `/${locale}/tax-advisory/booking?service=corporate-tax`,
-      price: "€150",
-      priceValue: 150,
+      price: formatPrice(locale, "tax-advisory/corporate-tax"),
+      priceValue: prices["tax-advisory/corporate-tax"].amount,
     },
     {
       id: "tax-compliance",
@@ -47,8 +48,8 @@ export default function TaxAdvisoryPage({ params: { locale } }: { params: { loca
       title: tTax('services.compliance.title'),
       description: tTax('services.compliance.description'),
       href: `/${locale}/tax-advisory/booking?service=tax-compliance`,
-      price: "€250",
-      priceValue: 250,
+      price: formatPrice(locale, "tax-advisory/tax-compliance"),
+      priceValue: prices["tax-advisory/tax-compliance"].amount,
     },
     {
       id: "personal-tax-advisory",
@@ -56,8 +57,8 @@ export default function TaxAdvisoryPage({ params: { locale } }: { params: { loca
       title: tTax('services.personal.title'),
       description: tTax('services.personal.description'),
       href: `/${locale}/tax-advisory/booking?service=personal-tax-advisory`,
-      price: "€100",
-      priceValue: 100,
+      price: formatPrice(locale, "tax-advisory/personal-tax-advisory"),
+      priceValue: prices["tax-advisory/personal-tax-advisory"].amount,
     },
   ];
 
@@ -8,10 +8,13 @@ import { SectionHeading } from "@/components/section-heading";
 import { Card, CardContent } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { useTranslations } from "next-intl";
+import { formatPrice, formatPriceBreakdown, prices, type PriceId } from "@/i18n/prices.generated";
 
 import { useState, useEffect, useRef } from "react";
 import emailjs from '@emailjs/browser';
 
+const PRICE_ID: PriceId = "tax-advisory/personal-tax-advisory";
+
 export default function PersonalTaxAdvisoryPage({ params: { locale } }: { params: { locale: string } }) {
   const t = useTranslations('taxAdvisory.personalTaxAdvisory');  const tCommon = useTranslations('taxAdvisory.internationalTax');
   const [step, setStep] = useState<'info' | 'calendar' | 'payment' | 'confirmation'>('info');
@@ -22,9 +25,10 @@ export default function PersonalTaxAdvisoryPage({ params: { locale } }: { params
   const [calendlyLoaded, setCalendlyLoaded] = useState(false);
   const paypalRef = useRef<HTMLDivElement>(null);
 
-  const totalPrice = 100;
-  const servicePrice = totalPrice / 1.17;
-  const vat = totalPrice - servicePrice;
+  const totalPrice = prices[PRICE_ID].amount;
+  const price = formatPriceBreakdown(locale, PRICE_ID);
+  // Receipts and notification emails are written in English
+  const receiptPrice = formatPriceBreakdown("en", PRICE_ID);
   // Initialize EmailJS
   useEffect(() => {
     emailjs.init('YOUR_PUBLIC_KEY'); // Replace with your EmailJS public key
@@ -51,9 +55,9 @@ Email: ${bookingData.inviteeEmail}
 PAYMENT DETAILS
 ==================================================
 Order ID: ${bookingData.paymentDetails.orderId}
-Amount: €100.00 (incl. VAT)
-Service Fee: €${(100 / 1.17).toFixed(2)} (excl. VAT)
-VAT (17%): €${(100 - 100 / 1.17).toFixed(2)}
+Amount: ${receiptPrice.total} (incl. VAT)
+Service Fee: ${receiptPrice.net} (excl. VAT)
+VAT (17%): ${receiptPrice.vat}
 Payment Method: PayPal
 Status: ${bookingData.paymentDetails.status}
 Date: ${new Date(bookingData.paymentDetails.timestamp).toLocaleString('en-US')}
@@ -82,9 +86,9 @@ Contact: opulanz.banking@gmail.com
       appointment_date: new Date(bookingData.eventStartTime).toLocaleDateString('en-US', { weekday: 'long', year: 'numeric', month: 'long', day: 'numeric' }),
       appointment_time: new Date(bookingData.eventStartTime).toLocaleTimeString('en-US', { hour: '2-digit', minute: '2-digit' }),
       order_id: bookingData.paymentDetails.orderId,
-      amount: '€100.00',
-      service_fee: '€' + (100 / 1.17).toFixed(2),
-      vat: '€' + (100 - 100 / 1.17).toFixed(2),
+      amount: receiptPrice.total,
+      service_fee: receiptPrice.net,
+      vat: receiptPrice.vat,
       payment_status: bookingData.paymentDetails.status,
       payment_date: new Date(bookingData.paymentDetails.timestamp).toLocaleString('en-US')
     };
@@ -207,7 +211,7 @@ Contact: opulanz.banking@gmail.com
           calendly_event_uri: bookingData.eventUri, meeting_type: t('hero.title'), status: 'confirmed',
           start_time: bookingData.eventStartTime, end_time: bookingData.eventEndTime,
           timezone: Intl.DateTimeFormat().resolvedOptions().timeZone, location: 'Video Conference',
-          notes: `Paid consultation - €${totalPrice}`
+          notes: `Paid consultation - ${receiptPrice.total}`
         })
       });
 
@@ -337,9 +341,9 @@ Contact: opulanz.banking@gmail.com
                   </div>
                 </div>
                 <div className="border-t border-brand-grayLight pt-6">
-                  <div className="flex justify-between items-center text-lg mb-3"><span className="text-brand-grayMed">{tCommon('payment.serviceFeeExcl')}</span><span className="font-semibold text-brand-dark">€{servicePrice.toFixed(2)}</span></div>
-                  <div className="flex justify-between items-center text-lg mb-3"><span className="text-brand-grayMed">{tCommon('payment.vat17')}</span><span className="font-semibold text-brand-dark">€{vat.toFixed(2)}</span></div>
-                  <div className="border-t border-brand-grayLight pt-4 mt-4"><div className="flex justify-between items-center"><span className="text-xl font-bold text-brand-dark">{tCommon('payment.totalIncl')}</span><span className="text-3xl font-bold text-brand-gold">€{totalPrice.toFixed(2)}</span></div></div>
+                  <div className="flex justify-between items-center text-lg mb-3"><span className="text-brand-grayMed">{tCommon('payment.serviceFeeExcl')}</span><span className="font-semibold text-brand-dark">{price.net}</span></div>
+                  <div className="flex justify-between items-center text-lg mb-3"><span className="text-brand-grayMed">{tCommon('payment.vat17')}</span><span className="font-semibold text-brand-dark">{price.vat}</span></div>
+                  <div className="border-t border-brand-grayLight pt-4 mt-4"><div className="flex justify-between items-center"><span className="text-xl font-bold text-brand-dark">{tCommon('payment.totalIncl')}</span><span className="text-3xl font-bold text-brand-gold">{price.total}</span></div></div>
                 </div>
               </CardContent>
             </Card>
@@ -348,7 +352,7 @@ Contact: opulanz.banking@gmail.com
                 <div className="text-center">
                   <div className="mb-6">
                     <h3 className="mb-2 text-xl font-bold text-brand-dark">{tCommon('payment.completeYourPayment')}</h3>
-                    <p className="text-3xl font-bold text-brand-gold">€{totalPrice.toFixed(2)}</p>
+                    <p className="text-3xl font-bold text-brand-gold">{price.total}</p>
                     <p className="mt-2 text-sm text-brand-grayMed">{tCommon('payment.oneTimePayment')}</p>
                   </div>
                   <div className="mx-auto max-w-md">
@@ -378,7 +382,7 @@ Contact: opulanz.banking@gmail.com
           <div className="container mx-auto max-w-4xl px-6">
             <div className="text-center">
               <h1 className="mb-4 text-3xl font-bold text-white md:text-4xl lg:text-5xl">{t('calendar.title')}</h1>
-              <p className="text-lg text-white/90">{t('calendar.subtitle', { price: totalPrice })}</p>
+              <p className="text-lg text-white/90">{t('calendar.subtitle', { price: formatPrice(locale, PRICE_ID) })}</p>
             </div>
           </div>
         </section>
@@ -386,7 +390,7 @@ Contact: opulanz.banking@gmail.com
           <div className="container mx-auto max-w-5xl px-6">
             <div className="grid gap-8 md:grid-cols-3 mb-8">
               <div className="text-center"><div className="mb-4 inline-flex h-12 w-12 items-center justify-center rounded-full bg-brand-goldLight"><Clock className="h-6 w-6 text-brand-goldDark" /></div><h3 className="mb-2 text-lg font-bold text-brand-dark">{t('calendar.consultation60')}</h3><p className="text-sm text-brand-grayMed">{t('calendar.consultationDesc')}</p></div>
-              <div className="text-center"><div className="mb-4 inline-flex h-12 w-12 items-center justify-center rounded-full bg-brand-goldLight"><Euro className="h-6 w-6 text-brand-goldDark" /></div><h3 className="mb-2 text-lg font-bold text-brand-dark">{t('calendar.feeLabel', { price: totalPrice })}</h3><p className="text-sm text-brand-grayMed">{t('calendar.feeDesc')}</p></div>
+              <div className="text-center"><div className="mb-4 inline-flex h-12 w-12 items-center justify-center rounded-full bg-brand-goldLight"><Euro className="h-6 w-6 text-brand-goldDark" /></div><h3 className="mb-2 text-lg font-bold text-brand-dark">{t('calendar.feeLabel', { price: formatPrice(locale, PRICE_ID) })}</h3><p className="text-sm text-brand-grayMed">{t('calendar.feeDesc')}</p></div>
               <div className="text-center"><div className="mb-4 inline-flex h-12 w-12 items-center justify-center rounded-full bg-brand-goldLight"><UserCheck className="h-6 w-6 text-brand-goldDark" /></div><h3 className="mb-2 text-lg font-bold text-brand-dark">{t('calendar.expertService')}</h3><p className="text-sm text-brand-grayMed">{t('calendar.expertDesc')}</p></div>
             </div>
             <div className="calendly-inline-widget" data-url="https://calendly.com/opulanz-banking/tax-advisory?hide_event_type_details=1&primary_color=d8ba4a" style={{ minWidth: '320px', height: '700px' }} />
@@ -436,7 +440,7 @@ Contact: opulanz.banking@gmail.com
           <h2 className="mb-6 text-3xl font-bold text-white md:text-4xl">{t('cta.title')}</h2>
           <p className="mx-auto mb-10 max-w-2xl text-lg text-white/90">{t('cta.description')}</p>
           <div className="flex flex-col items-center gap-4 sm:flex-row justify-center">
-            <Button onClick={() => setStep('calendar')} size="lg" className="bg-white text-brand-dark hover:bg-gray-50 min-w-48">{t('cta.bookButton', { price: totalPrice })}</Button>
+            <Button onClick={() => setStep('calendar')} size="lg" className="bg-white text-brand-dark hover:bg-gray-50 min-w-48">{t('cta.bookButton', { price: formatPrice(locale, PRICE_ID) })}</Button>
             <Button asChild variant="outline" size="lg" className="border-2 border-white bg-transparent text-white hover:bg-white/10 min-w-48"><Link href={`/${locale}/tax-advisory`}>{t('cta.backToTaxAdvisory')}</Link></Button>
           </div>
         </div>
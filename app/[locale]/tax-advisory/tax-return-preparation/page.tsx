@@ -8,10 +8,13 @@ import { SectionHeading } from "@/components/section-heading";
 import { Card, CardContent } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { useTranslations } from "next-intl";
+import { formatPrice, formatPriceBreakdown, prices, type PriceId } from "@/i18n/prices.generated";
 
 import { useState, useEffect, useRef } from "react";
 import emailjs from '@emailjs/browser';
 
+const PRICE_ID: PriceId = "tax-advisory/tax-return-preparation";
+
 export default function TaxReturnPreparationPage({ params: { locale } }: { params: { locale: string } }) {
   const t = useTranslations('taxAdvisory.taxReturnPreparation');
   const tCommon = useTranslations('taxAdvisory.internationalTax');
@@ -51,9 +54,10 @@ export default function TaxReturnPreparationPage({ params: { locale } }: { param
     }
   }, [bookingData, step]);
 
-  const totalPrice = 299;
-  const servicePrice = totalPrice / 1.17; // Price without VAT
-  const vat = totalPrice - servicePrice;
+  const totalPrice = prices[PRICE_ID].amount;
+  const price = formatPriceBreakdown(locale, PRICE_ID);
+  // Receipts and notification emails are written in English
+  const receiptPrice = formatPriceBreakdown("en", PRICE_ID);
   // Initialize EmailJS
   useEffect(() => {
     emailjs.init('YOUR_PUBLIC_KEY'); // Replace with your EmailJS public key
@@ -80,9 +84,9 @@ Email: ${bookingData.inviteeEmail}
 PAYMENT DETAILS
 ==================================================
 Order ID: ${bookingData.paymentDetails.orderId}
-Amount: €299.00 (incl. VAT)
-Service Fee: €${(299 / 1.17).toFixed(2)} (excl. VAT)
-VAT (17%): €${(299 - 299 / 1.17).toFixed(2)}
+Amount: ${receiptPrice.total} (incl. VAT)
+Service Fee: ${receiptPrice.net} (excl. VAT)
+VAT (17%): ${receiptPrice.vat}
 Payment Method: PayPal
 Status: ${bookingData.paymentDetails.status}
 Date: ${new Date(bookingData.paymentDetails.timestamp).toLocaleString('en-US')}
@@ -111,9 +115,9 @@ Contact: opulanz.banking@gmail.com
       appointment_date: new Date(bookingData.eventStartTime).toLocaleDateString('en-US', { weekday: 'long', year: 'numeric', month: 'long', day: 'numeric' }),
       appointment_time: new Date(bookingData.eventStartTime).toLocaleTimeString('en-US', { hour: '2-digit', minute: '2-digit' }),
       order_id: bookingData.paymentDetails.orderId,
-      amount: '€299.00',
-      service_fee: '€' + (299 / 1.17).toFixed(2),
-      vat: '€' + (299 - 299 / 1.17).toFixed(2),
+      amount: receiptPrice.total,
+      service_fee: receiptPrice.net,
+      vat: receiptPrice.vat,
       payment_status: bookingData.paymentDetails.status,
       payment_date: new Date(bookingData.paymentDetails.timestamp).toLocaleString('en-US')
     };
@@ -279,7 +283,7 @@ Contact: opulanz.banking@gmail.com
           end_time: bookingData.eventEndTime,
           timezone: Intl.DateTimeFormat().resolvedOptions().timeZone,
           location: 'Video Conference',
-          notes: `Paid consultation - €${totalPrice}`
+          notes: `Paid consultation - ${receiptPrice.total}`
         })
       });
 
@@ -553,16 +557,16 @@ Contact: opulanz.banking@gmail.com
                 <div className="border-t border-brand-grayLight pt-6">
                   <div className="flex justify-between items-center text-lg mb-3">
                     <span className="text-brand-grayMed">{tCommon('payment.serviceFeeExcl')}</span>
-                    <span className="font-semibold text-brand-dark">€{servicePrice.toFixed(2)}</span>
+                    <span className="font-semibold text-brand-dark">{price.net}</span>
                   </div>
                   <div className="flex justify-between items-center text-lg mb-3">
                     <span className="text-brand-grayMed">{tCommon('payment.vat17')}</span>
-                    <span className="font-semibold text-brand-dark">€{vat.toFixed(2)}</span>
+                    <span className="font-semibold text-brand-dark">{price.vat}</span>
                   </div>
                   <div className="border-t border-brand-grayLight pt-4 mt-4">
                     <div className="flex justify-between items-center">
                       <span className="text-xl font-bold text-brand-dark">{tCommon('payment.totalIncl')}</span>
-                      <span className="text-3xl font-bold text-brand-gold">€{totalPrice.toFixed(2)}</span>
+                      <span className="text-3xl font-bold text-brand-gold">{price.total}</span>
                     </div>
                   </div>
                 </div>
@@ -576,7 +580,7 @@ Contact: opulanz.banking@gmail.com
                     <h3 className="mb-2 text-xl font-bold text-brand-dark">
                       {tCommon('payment.completeYourPayment')}
                     </h3>
-                    <p className="text-3xl font-bold text-brand-gold">€{totalPrice.toFixed(2)}</p>
+                    <p className="text-3xl font-bold text-brand-gold">{price.total}</p>
                     <p className="mt-2 text-sm text-brand-grayMed">
                       {tCommon('payment.oneTimePayment')}
                     </p>
@@ -633,7 +637,7 @@ Contact: opulanz.banking@gmail.com
                 {t('calendar.title')}
               </h1>
               <p className="text-lg text-white/90">
-                {t('calendar.subtitle', { price: totalPrice })}
+                {t('calendar.subtitle', { price: formatPrice(locale, PRICE_ID) })}
               </p>
             </div>
           </div>
@@ -656,7 +660,7 @@ Contact: opulanz.banking@gmail.com
                 <div className="mb-4 inline-flex h-12 w-12 items-center justify-center rounded-full bg-brand-goldLight">
                   <Euro className="h-6 w-6 text-brand-goldDark" />
                 </div>
-                <h3 className="mb-2 text-lg font-bold text-brand-dark">{t('calendar.feeLabel', { price: totalPrice })}</h3>
+                <h3 className="mb-2 text-lg font-bold text-brand-dark">{t('calendar.feeLabel', { price: formatPrice(locale, PRICE_ID) })}</h3>
                 <p className="text-sm text-brand-grayMed">
                   {t('calendar.feeDesc')}
                 </p>
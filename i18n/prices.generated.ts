@@ -0,0 +1,238 @@
+// Generated by scripts/build_prices.py from i18n/prices.json.
+// Do not edit by hand: run `python3 scripts/build_prices.py`.
+
+export const prices = {
+  "tax-advisory/tax-return-preparation": {
+    "amount": 299,
+    "currency": "EUR",
+    "vatRate": 0.17,
+    "net": 255.56,
+    "vat": 43.44
+  },
+  "tax-advisory/international-tax": {
+    "amount": 250,
+    "currency": "EUR",
+    "vatRate": 0.17,
+    "net": 213.68,
+    "vat": 36.32
+  },
+  "tax-advisory/corporate-tax": {
+    "amount": 150,
+    "currency": "EUR",
+    "vatRate": 0.17,
+    "net": 128.21,
+    "vat": 21.79
+  },
+  "tax-advisory/tax-compliance": {
+    "amount": 250,
+    "currency": "EUR",
+    "vatRate": 0.17,
+    "net": 213.68,
+    "vat": 36.32
+  },
+  "tax-advisory/personal-tax-advisory": {
+    "amount": 100,
+    "currency": "EUR",
+    "vatRate": 0.17,
+    "net": 85.47,
+    "vat": 14.53
+  }
+} as const;
+
+export type PriceId = keyof typeof prices;
+
+/** Precomputed locale-formatted prices (no Intl.NumberFormat at render time) */
+export const formattedPrices: Record<string, Record<PriceId, string>> = {
+  "en": {
+    "tax-advisory/tax-return-preparation": "€299",
+    "tax-advisory/international-tax": "€250",
+    "tax-advisory/corporate-tax": "€150",
+    "tax-advisory/tax-compliance": "€250",
+    "tax-advisory/personal-tax-advisory": "€100"
+  },
+  "fr": {
+    "tax-advisory/tax-return-preparation": "299 €",
+    "tax-advisory/international-tax": "250 €",
+    "tax-advisory/corporate-tax": "150 €",
+    "tax-advisory/tax-compliance": "250 €",
+    "tax-advisory/personal-tax-advisory": "100 €"
+  },
+  "en-GB": {
+    "tax-advisory/tax-return-preparation": "€299",
+    "tax-advisory/international-tax": "€250",
+    "tax-advisory/corporate-tax": "€150",
+    "tax-advisory/tax-compliance": "€250",
+    "tax-advisory/personal-tax-advisory": "€100"
+  },
+  "fr-FR": {
+    "tax-advisory/tax-return-preparation": "299 €",
+    "tax-advisory/international-tax": "250 €",
+    "tax-advisory/corporate-tax": "150 €",
+    "tax-advisory/tax-compliance": "250 €",
+    "tax-advisory/personal-tax-advisory": "100 €"
+  },
+  "fr-LU": {
+    "tax-advisory/tax-return-preparation": "299 €",
+    "tax-advisory/international-tax": "250 €",
+    "tax-advisory/corporate-tax": "150 €",
+    "tax-advisory/tax-compliance": "250 €",
+    "tax-advisory/personal-tax-advisory": "100 €"
+  }
+};
+
+export type PriceBreakdown = { net: string; vat: string; total: string };
+
+/** VAT-inclusive prices split into net / VAT / total, formatted with cents */
+export const formattedBreakdowns: Record<string, Record<PriceId, PriceBreakdown>> = {
+  "en": {
+    "tax-advisory/tax-return-preparation": {
+      "net": "€255.56",
+      "vat": "€43.44",
+      "total": "€299.00"
+    },
+    "tax-advisory/international-tax": {
+      "net": "€213.68",
+      "vat": "€36.32",
+      "total": "€250.00"
+    },
+    "tax-advisory/corporate-tax": {
+      "net": "€128.21",
+      "vat": "€21.79",
+      "total": "€150.00"
+    },
+    "tax-advisory/tax-compliance": {
+      "net": "€213.68",
+      "vat": "€36.32",
+      "total": "€250.00"
+    },
+    "tax-advisory/personal-tax-advisory": {
+      "net": "€85.47",
+      "vat": "€14.53",
+      "total": "€100.00"
+    }
+  },
+  "fr": {
+    "tax-advisory/tax-return-preparation": {
+      "net": "255,56 €",
+      "vat": "43,44 €",
+      "total": "299,00 €"
+    },
+    "tax-advisory/international-tax": {
+      "net": "213,68 €",
+      "vat": "36,32 €",
+      "total": "250,00 €"
+    },
+    "tax-advisory/corporate-tax": {
+      "net": "128,21 €",
+      "vat": "21,79 €",
+      "total": "150,00 €"
+    },
+    "tax-advisory/tax-compliance": {
+      "net": "213,68 €",
+      "vat": "36,32 €",
+      "total": "250,00 €"
+    },
+    "tax-advisory/personal-tax-advisory": {
+      "net": "85,47 €",
+      "vat": "14,53 €",
+      "total": "100,00 €"
+    }
+  },
+  "en-GB": {
+    "tax-advisory/tax-return-preparation": {
+      "net": "€255.56",
+      "vat": "€43.44",
+      "total": "€299.00"
+    },
+    "tax-advisory/international-tax": {
+      "net": "€213.68",
+      "vat": "€36.32",
+      "total": "€250.00"
+    },
+    "tax-advisory/corporate-tax": {
+      "net": "€128.21",
+      "vat": "€21.79",
+      "total": "€150.00"
+    },
+    "tax-advisory/tax-compliance": {
+      "net": "€213.68",
+      "vat": "€36.32",
+      "total": "€250.00"
+    },
+    "tax-advisory/personal-tax-advisory": {
+      "net": "€85.47",
+      "vat": "€14.53",
+      "total": "€100.00"
+    }
+  },
+  "fr-FR": {
+    "tax-advisory/tax-return-preparation": {
+      "net": "255,56 €",
+      "vat": "43,44 €",
+      "total": "299,00 €"
+    },
+    "tax-advisory/international-tax": {
+      "net": "213,68 €",
+      "vat": "36,32 €",
+      "total": "250,00 €"
+    },
+    "tax-advisory/corporate-tax": {
+      "net": "128,21 €",
+      "vat": "21,79 €",
+      "total": "150,00 €"
+    },
+    "tax-advisory/tax-compliance": {
+      "net": "213,68 €",
+      "vat": "36,32 €",
+      "total": "250,00 €"
+    },
+    "tax-advisory/personal-tax-advisory": {
+      "net": "85,47 €",
+      "vat": "14,53 €",
+      "total": "100,00 €"
+    }
+  },
+  "fr-LU": {
+    "tax-advisory/tax-return-preparation": {
+      "net": "255,56 €",
+      "vat": "43,44 €",
+      "total": "299,00 €"
+    },
+    "tax-advisory/international-tax": {
+      "net": "213,68 €",
+      "vat": "36,32 €",
+      "total": "250,00 €"
+    },
+    "tax-advisory/corporate-tax": {
+      "net": "128,21 €",
+      "vat": "21,79 €",
+      "total": "150,00 €"
+    },
+    "tax-advisory/tax-compliance": {
+      "net": "213,68 €",
+      "vat": "36,32 €",
+      "total": "250,00 €"
+    },
+    "tax-advisory/personal-tax-advisory": {
+      "net": "85,47 €",
+      "vat": "14,53 €",
+      "total": "100,00 €"
+    }
+  }
+};
+
+function forLocale<T>(tables: Record<string, T>, locale: string): T {
+  return tables[locale] ?? tables[locale.split('-')[0]] ?? tables['en'];
+}
+
+export function isPriceId(id: string): id is PriceId {
+  return id in prices;
+}
+
+export function formatPrice(locale: string, id: PriceId): string {
+  return forLocale(formattedPrices, locale)[id];
+}
+
+export function formatPriceBreakdown(locale: string, id: PriceId): PriceBreakdown {
+  return forLocale(formattedBreakdowns, locale)[id];
+}
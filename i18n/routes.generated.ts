@@ -0,0 +1,80 @@
+// Generated by scripts/build_route_table.py from i18n/routing.ts.
+// Do not edit by hand: run `python3 scripts/build_route_table.py`.
+
+type RouteNode = { s?: Record<string, RouteNode>; p?: RouteNode; r?: [string, string] };
+
+export const routeLocales = [
+  "en",
+  "fr"
+] as const;
+
+/** internal pathname → localized pathname, per locale */
+export const localizedPathnames: Record<string, Record<string, string>> = {
+  "en": {
+    "/": "/",
+    "/company-formation": "/company-formation",
+    "/dashboard": "/dashboard",
+    "/open-account": "/open-account"
+  },
+  "fr": {
+    "/": "/",
+    "/company-formation": "/creation-entreprise",
+    "/dashboard": "/dashboard",
+    "/open-account": "/ouvrir-compte"
+  }
+};
+
+/** localized pathname → internal pathname, per locale */
+export const internalPathnames: Record<string, Record<string, string>> = {
+  "en": {
+    "/": "/",
+    "/company-formation": "/company-formation",
+    "/dashboard": "/dashboard",
+    "/open-account": "/open-account"
+  },
+  "fr": {
+    "/": "/",
+    "/creation-entreprise": "/company-formation",
+    "/dashboard": "/dashboard",
+    "/ouvrir-compte": "/open-account"
+  }
+};
+
+/** Segment tries for pathnames with dynamic [param] segments */
+const dynamicRoutes: Record<string, { toLocalized: RouteNode; toInternal: RouteNode }> = {};
+
+function matchTrie(root: RouteNode, pathname: string): string | undefined {
+  const segments = pathname.split('/').filter(Boolean);
+  const values: string[] = [];
+  let node: RouteNode = root;
+  for (const segment of segments) {
+    const next: RouteNode | undefined = node.s?.[segment];
+    if (next) {
+      node = next;
+    } else if (node.p) {
+      values.push(segment);
+      node = node.p;
+    } else {
+      return undefined;
+    }
+  }
+  if (!node.r) return undefined;
+  let i = 0;
+  return node.r[1].replace(/\[[^\]]+\]/g, () => values[i++]);
+}
+
+/** Map an internal pathname (e.g. '/open-account') to its localized form */
+export function toLocalizedPathname(locale: string, pathname: string): string {
+  const exact = localizedPathnames[locale]?.[pathname];
+  if (exact !== undefined) return exact;
+  const trie = dynamicRoutes[locale];
+  return (trie && matchTrie(trie.toLocalized, pathname)) ?? pathname;
+}
+
+/** Map a localized pathname (e.g. '/ouvrir-compte') back to the internal route */
+export function toInternalPathname(locale: string, pathname: string): string {
+  const exact = internalPathnames[locale]?.[pathname];
+  if (exact !== undefined) return exact;
+  const trie = dynamicRoutes[locale];
+  return (trie && matchTrie(trie.toInternal, pathname)) ?? pathname;
+}
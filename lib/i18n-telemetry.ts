@@ -0,0 +1,82 @@
+/**
+ * Sampled translation key-hit telemetry (server only).
+ *
+ * Wrap a next-intl translator with `trackTranslations` in a server component
+ * or route handler to record which message keys each route renders. Sampled
+ * renders are buffered and appended as JSONL to I18N_TELEMETRY_FILE
+ * (default .i18n-telemetry/hits.jsonl), one line per render:
+ *
+ *   {"ts":1730000000,"route":"/tax-advisory","locale":"en","keys":{"taxAdvisory.hero.title":1}}
+ *
+ * Telemetry is off unless I18N_TELEMETRY_SAMPLE is set to a rate in (0, 1].
+ * Aggregate with `python3 scripts/key_heat.py aggregate`.
+ */
+import { appendFile, mkdir } from "fs/promises";
+import { dirname } from "path";
+
+const SAMPLE_RATE = Number(process.env.I18N_TELEMETRY_SAMPLE ?? 0);
+const TELEMETRY_FILE = process.env.I18N_TELEMETRY_FILE ?? ".i18n-telemetry/hits.jsonl";
+const FLUSH_INTERVAL_MS = 5000;
+
+let buffer: string[] = [];
+let flushTimer: ReturnType<typeof setTimeout> | null = null;
+
+async function flush() {
+  flushTimer = null;
+  if (buffer.length === 0) return;
+  const lines = buffer.join("");
+  buffer = [];
+  try {
+    await mkdir(dirname(TELEMETRY_FILE), { recursive: true });
+    await appendFile(TELEMETRY_FILE, lines, "utf8");
+  } catch {
+    // Telemetry must never break rendering
+  }
+}
+
+export function recordKeyHits(route: string, locale: string, keys: Record<string, number>) {
+  if (Object.keys(keys).length === 0) return;
+  buffer.push(JSON.stringify({ ts: Math.floor(Date.now() / 1000), route, locale, keys }) + "\n");
+  if (!flushTimer) flushTimer = setTimeout(flush, FLUSH_INTERVAL_MS);
+}
+
+type Translator = ((key: string, ...args: any[]) => any) & Record<string, any>;
+
+export function trackTranslations<T extends Translator>(
+  t: T,
+  { route, locale, namespace }: { route: string; locale: string; namespace?: string }
+): T {
+  if (!(SAMPLE_RATE > 0) || Math.random() >= SAMPLE_RATE) return t;
+
+  const prefix = namespace ? `${namespace}.` : "";
+  let hits: Record<string, number> = {};
+  let scheduled = false;
+
+  const count = (key: string) => {
+    hits[prefix + key] = (hits[prefix + key] ?? 0) + 1;
+    if (!scheduled) {
+      scheduled = true;
+      // One line per render: collect every t() call made in this tick
+      queueMicrotask(() => {
+        recordKeyHits(route, locale, hits);
+        hits = {};
+        scheduled = false;
+      });
+    }
+  };
+
+  const wrapped = ((key: string, ...args: any[]) => {
+    count(key);
+    return t(key, ...args);
+  }) as T;
+  for (const method of ["rich", "markup", "raw"]) {
+    if (typeof t[method] === "function") {
+      (wrapped as Translator)[method] = (key: string, ...args: any[]) => {
+        count(key);
+        return t[method](key, ...args);
+      };
+    }
+  }
+  if (typeof t.has === "function") (wrapped as Translator).has = t.has.bind(t);
+  return wrapped;
+}
@@ -1,7 +1,26 @@
 import createMiddleware from 'next-intl/middleware';
+import { NextResponse, type NextRequest } from 'next/server';
 import { routing } from './i18n/routing';
+import { routeLocales, toLocalizedPathname } from './i18n/routes.generated';
 
-export default createMiddleware(routing);
+const intlMiddleware = createMiddleware(routing);
+
+export default function middleware(request: NextRequest) {
+  // Send internal slugs to their localized form (e.g. /fr/open-account →
+  // /fr/ouvrir-compte) with a single lookup in the generated route table,
+  // before next-intl matches the request against every pathname.
+  const [, locale, ...rest] = request.nextUrl.pathname.split('/');
+  if ((routeLocales as readonly string[]).includes(locale)) {
+    const pathname = '/' + rest.join('/');
+    const localized = toLocalizedPathname(locale, pathname);
+    if (localized !== pathname) {
+      const url = request.nextUrl.clone();
+      url.pathname = `/${locale}${localized === '/' ? '' : localized}`;
+      return NextResponse.redirect(url);
+    }
+  }
+  return intlMiddleware(request);
+}
 
 export const config = {
   matcher: [
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Minimal Aho-Corasick multi-pattern matcher used by the i18n tooling.
+
+Build the automaton once from all patterns, then find every occurrence of
+every pattern in a text with a single left-to-right pass, independent of
+the number of patterns.
+"""
+
+
+class Automaton:
+    """Multi-pattern string matcher (Aho-Corasick)"""
+
+    __slots__ = ('_goto', '_fail', '_out', '_patterns', 'ignore_case', 'whole_words')
+
+    def __init__(self, patterns=(), ignore_case=False, whole_words=True):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        self._patterns = []
+        self.ignore_case = ignore_case
+        self.whole_words = whole_words
+        for pattern in patterns:
+            self.add(pattern)
+        self.build()
+
+    def __len__(self):
+        return len(self._patterns)
+
+    def add(self, pattern, value=None):
+        """Add a pattern (before build()); ``value`` is returned on match, default the pattern"""
+        if not pattern:
+            raise ValueError('empty pattern')
+        text = pattern.lower() if self.ignore_case else pattern
+        state = 0
+        for ch in text:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        index = len(self._patterns)
+        self._patterns.append((len(text), pattern if value is None else value))
+        self._out[state] = self._out[state] + (index,)
+
+    def build(self):
+        """Compute failure links (breadth-first); call after the last add()"""
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = list(goto[0].values())
+        for state in queue:
+            fail[state] = 0
+        for state in queue:
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+        return self
+
+    def iter(self, text):
+        """Yield (start, end, value) for every match in ``text``"""
+        haystack = text.lower() if self.ignore_case else text
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self._patterns
+        whole_words = self.whole_words
+        state = 0
+        for i, ch in enumerate(haystack):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            end = i + 1
+            for index in out[state]:
+                length, value = patterns[index]
+                start = end - length
+                if whole_words and (_is_word(haystack, start - 1) or _is_word(haystack, end)):
+                    continue
+                yield start, end, value
+
+    def find_all(self, text):
+        """Set of values for every pattern found in ``text``"""
+        return {value for _, _, value in self.iter(text)}
+
+
+def _is_word(text, index):
+    """True if text[index] exists and is a word character"""
+    return 0 <= index < len(text) and (text[index].isalnum() or text[index] == '_')
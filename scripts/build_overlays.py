@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Resolve regional locale overlays (fr-LU, fr-FR, en-GB...) into full
+catalogs.
+
+An overlay in messages/overlays/<locale>.json stores only the keys that
+differ from its base catalog (configured in i18n/overlays.json). At build
+time (`npm run build` runs this script as its prebuild step) each overlay
+is applied to its base and written to messages/<locale>.json. Outputs are
+cached by the hashes of base and overlay, so only overlays whose inputs
+changed are rebuilt.
+
+Usage:
+    python3 scripts/build_overlays.py                     # resolve all overlays
+    python3 scripts/build_overlays.py --check             # validate deltas only
+    python3 scripts/build_overlays.py extract fr-LU full-fr-LU.json
+                                                          # turn a full copy into a delta
+"""
+import argparse
+import json
+import os
+import sys
+
+from catalog import Catalog
+from i18n_common import (
+    MESSAGES_DIR, ROOT_DIR, catalog_path, dump_catalog, file_sha1, load_cache,
+    save_cache, sha1_bytes,
+)
+
+CONFIG_PATH = os.path.join(ROOT_DIR, 'i18n', 'overlays.json')
+OVERLAY_DIR = os.path.join(MESSAGES_DIR, 'overlays')
+CACHE_NAME = 'overlays.json'
+
+
+def load_config(path=CONFIG_PATH):
+    """{locale: {'base': base_locale}}"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['overlays']
+
+
+def overlay_path(locale):
+    return os.path.join(OVERLAY_DIR, f'{locale}.json')
+
+
+def load_overlay(locale):
+    """The overlay delta as a Catalog (empty if the file does not exist)"""
+    try:
+        with open(overlay_path(locale), 'r', encoding='utf-8') as f:
+            return Catalog(json.load(f))
+    except FileNotFoundError:
+        return Catalog()
+
+
+def check_overlay(base, overlay):
+    """Return (unknown_keys, redundant_keys) of an overlay against its base"""
+    unknown, redundant = [], []
+    for key, value in overlay.items():
+        if not base.is_message(key):
+            unknown.append(key)
+        elif base[key] == value:
+            redundant.append(key)
+    return unknown, redundant
+
+
+def resolve(base, overlay):
+    """Apply an overlay to (a copy of) its base catalog"""
+    resolved = Catalog(base.to_dict())
+    for key, value in overlay.items():
+        resolved[key] = value
+    return resolved
+
+
+def extract_delta(base, full):
+    """Nested delta holding only the messages of ``full`` that differ from ``base``"""
+    delta = Catalog()
+    for key, _, value in base.diff(full):
+        if value is not None:
+            delta[key] = value
+    return delta
+
+
+def build(config, force=False, check_only=False):
+    """Resolve every overlay; returns (built, cached, errors)"""
+    cache = load_cache(CACHE_NAME)
+    built, cached, errors = [], [], []
+    bases = {}
+
+    for locale, spec in sorted(config.items()):
+        base_locale = spec['base']
+        if not os.path.exists(catalog_path(base_locale)):
+            errors.append(f"{locale}: base catalog messages/{base_locale}.json does not exist")
+            continue
+        overlay_file = overlay_path(locale)
+        fingerprint = sha1_bytes(
+            (file_sha1(catalog_path(base_locale)) + ':' +
+             (file_sha1(overlay_file) if os.path.exists(overlay_file) else '-')).encode()
+        )
+        output = catalog_path(locale)
+        if (not force and not check_only and cache.get(locale) == fingerprint
+                and os.path.exists(output)):
+            cached.append(locale)
+            continue
+
+        if base_locale not in bases:
+            bases[base_locale] = Catalog.load(base_locale)
+        base = bases[base_locale]
+        overlay = load_overlay(locale)
+        unknown, redundant = check_overlay(base, overlay)
+        errors += [f"{locale}: '{key}' is not a message in {base_locale}" for key in unknown]
+        errors += [f"{locale}: '{key}' is identical to {base_locale}" for key in redundant]
+        if check_only or unknown:
+            continue
+
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(dump_catalog(resolve(base, overlay).to_dict()))
+        cache[locale] = fingerprint
+        built.append((locale, sum(1 for _ in overlay.items())))
+
+    if not check_only:
+        save_cache(CACHE_NAME, cache)
+    return built, cached, errors
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['extract']:
+        parser = argparse.ArgumentParser(prog='build_overlays.py extract',
+                                         description='write the delta of a full catalog as an overlay')
+        parser.add_argument('locale')
+        parser.add_argument('full', help='full catalog JSON for the regional locale')
+        args = parser.parse_args(argv[1:])
+        base_locale = load_config()[args.locale]['base']
+        with open(args.full, 'r', encoding='utf-8') as f:
+            full = Catalog(json.load(f))
+        delta = extract_delta(Catalog.load(base_locale), full)
+        os.makedirs(OVERLAY_DIR, exist_ok=True)
+        with open(overlay_path(args.locale), 'w', encoding='utf-8') as f:
+            f.write(dump_catalog(delta.to_dict()) + '\n')
+        print(f"✅ {args.locale}: {len(delta)} differing keys written to "
+              f"messages/overlays/{args.locale}.json")
+        return 0
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--check', action='store_true', help='validate overlays without writing')
+    parser.add_argument('--force', action='store_true', help='ignore the build cache')
+    args = parser.parse_args(argv)
+
+    print("🌍 Resolving regional overlays...")
+    built, cached, errors = build(load_config(), force=args.force, check_only=args.check)
+    for locale, size in built:
+        print(f"   {locale}: {size} overriding keys → messages/{locale}.json")
+    if cached:
+        print(f"   Up to date: {', '.join(cached)}")
+    for error in errors:
+        print(f"⚠️  {error}")
+    # Redundant keys are only warnings; unknown keys and missing bases fail the build
+    return 1 if any('is not a message' in e or 'does not exist' in e for e in errors) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
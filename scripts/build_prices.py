@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Build locale-formatted prices from the typed price table in i18n/prices.json.
+
+Prices used to live in the catalogs as preformatted strings ('€299') that
+were repeated per locale and drifted apart. The table is now the single
+source of truth: this script formats every price for every locale with a
+local formatting table (no Intl at build or run time) and generates
+i18n/prices.generated.ts, so components look up `formatPrice(locale, id)`
+instead of formatting on each render. Amounts include VAT; the net/VAT/total
+split used by checkout summaries and receipts is precomputed as well
+(`formatPriceBreakdown`). Prices with a `messageKey` are also written into
+messages/<locale>.json so `t('...price')` stays in sync.
+
+Usage:
+    python3 scripts/build_prices.py                   # regenerate + sync catalogs
+    python3 scripts/build_prices.py --check           # fail if anything is stale
+    python3 scripts/build_prices.py extract taxAdvisory.services
+                                                      # pull '*.price' strings into the table
+"""
+import argparse
+import json
+import os
+import re
+import sys
+
+from catalog import Catalog
+from i18n_common import DEFAULT_LOCALE, LOCALES, ROOT_DIR, relpath, set_path, update_catalog
+
+PRICES_PATH = os.path.join(ROOT_DIR, 'i18n', 'prices.json')
+OUTPUT_PATH = os.path.join(ROOT_DIR, 'i18n', 'prices.generated.ts')
+OVERLAYS_PATH = os.path.join(ROOT_DIR, 'i18n', 'overlays.json')
+
+NBSP, NNBSP = '\u00a0', '\u202f'
+
+# Number/currency formatting per locale (CLDR conventions). Regional locales
+# fall back to their language, then to the default locale.
+LOCALE_FORMATS = {
+    'en': {'group': ',', 'decimal': '.', 'pattern': '{symbol}{number}'},
+    'fr': {'group': NNBSP, 'decimal': ',', 'pattern': '{number}' + NBSP + '{symbol}'},
+    'fr-LU': {'group': '.', 'decimal': ',', 'pattern': '{number}' + NBSP + '{symbol}'},
+    'de': {'group': '.', 'decimal': ',', 'pattern': '{number}' + NBSP + '{symbol}'},
+}
+CURRENCY_SYMBOLS = {'EUR': '€', 'USD': '$', 'GBP': '£', 'CHF': 'CHF'}
+
+AMOUNT_RE = re.compile(r'(?:€\s*([\d.,\s]*\d)|([\d.,\s]*\d)\s*€)')  # \s covers NBSP/NNBSP
+
+
+def locale_format(locale):
+    for candidate in (locale, locale.split('-')[0], DEFAULT_LOCALE):
+        if candidate in LOCALE_FORMATS:
+            return LOCALE_FORMATS[candidate]
+
+
+def format_amount(amount, currency, locale, decimals=None):
+    """Format an amount like Intl.NumberFormat(locale, {style: 'currency'}) would"""
+    fmt = locale_format(locale)
+    if decimals is None:
+        decimals = 0 if float(amount).is_integer() else 2
+    whole, _, fraction = f'{abs(amount):.{decimals}f}'.partition('.')
+    groups = []
+    while len(whole) > 3:
+        groups.insert(0, whole[-3:])
+        whole = whole[:-3]
+    number = fmt['group'].join([whole] + groups)
+    if fraction:
+        number += fmt['decimal'] + fraction
+    text = fmt['pattern'].format(symbol=CURRENCY_SYMBOLS.get(currency, currency), number=number)
+    return ('-' + text) if amount < 0 else text
+
+
+def load_prices(path=PRICES_PATH):
+    """{price_id: price}, with the table-wide vatRate applied where not overridden"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    prices = data['prices']
+    for price in prices.values():
+        price.setdefault('vatRate', data.get('vatRate', 0))
+    return prices
+
+
+def format_price(locale, price_id, prices=None):
+    """Formatted price for one locale, e.g. format_price('fr', 'tax-advisory/corporate-tax')"""
+    price = (prices or load_prices())[price_id]
+    return format_amount(price['amount'], price['currency'], locale, price.get('decimals'))
+
+
+def price_breakdown(price):
+    """Split a VAT-inclusive amount into {'net', 'vat', 'total'}, rounded to cents"""
+    total = price['amount']
+    net = round(total / (1 + price['vatRate']), 2)
+    return {'net': net, 'vat': round(total - net, 2), 'total': total}
+
+
+def format_breakdown(locale, price):
+    """Breakdown formatted with cents, e.g. {'net': '€255.56', 'vat': '€43.44', 'total': '€299.00'}"""
+    return {part: format_amount(value, price['currency'], locale, 2)
+            for part, value in price_breakdown(price).items()}
+
+
+def target_locales():
+    """Base locales plus regional overlays"""
+    locales = list(LOCALES)
+    try:
+        with open(OVERLAYS_PATH, 'r', encoding='utf-8') as f:
+            locales += sorted(json.load(f)['overlays'])
+    except OSError:
+        pass
+    return locales
+
+
+def render_ts(prices, locales):
+    table = {pid: {'amount': p['amount'], 'currency': p['currency'], 'vatRate': p['vatRate'],
+                   **{k: v for k, v in price_breakdown(p).items() if k != 'total'}}
+             for pid, p in prices.items()}
+    formatted = {loc: {pid: format_price(loc, pid, prices) for pid in prices} for loc in locales}
+    breakdowns = {loc: {pid: format_breakdown(loc, p) for pid, p in prices.items()}
+                  for loc in locales}
+
+    def js(value):
+        return json.dumps(value, indent=2, ensure_ascii=False)
+
+    return f"""// Generated by scripts/build_prices.py from i18n/prices.json.
+// Do not edit by hand: run `python3 scripts/build_prices.py`.
+
+export const prices = {js(table)} as const;
+
+export type PriceId = keyof typeof prices;
+
+/** Precomputed locale-formatted prices (no Intl.NumberFormat at render time) */
+export const formattedPrices: Record<string, Record<PriceId, string>> = {js(formatted)};
+
+export type PriceBreakdown = {{ net: string; vat: string; total: string }};
+
+/** VAT-inclusive prices split into net / VAT / total, formatted with cents */
+export const formattedBreakdowns: Record<string, Record<PriceId, PriceBreakdown>> = {js(breakdowns)};
+
+function forLocale<T>(tables: Record<string, T>, locale: string): T {{
+  return tables[locale] ?? tables[locale.split('-')[0]] ?? tables['{DEFAULT_LOCALE}'];
+}}
+
+export function isPriceId(id: string): id is PriceId {{
+  return id in prices;
+}}
+
+export function formatPrice(locale: string, id: PriceId): string {{
+  return forLocale(formattedPrices, locale)[id];
+}}
+
+export function formatPriceBreakdown(locale: string, id: PriceId): PriceBreakdown {{
+  return forLocale(formattedBreakdowns, locale)[id];
+}}
+"""
+
+
+def parse_amount(text):
+    """'€1,250' / '1 250 €' / '€99.50' → number (None if not a price)"""
+    match = AMOUNT_RE.search(text)
+    if not match:
+        return None
+    digits = re.sub(r'\s', '', match.group(1) or match.group(2))
+    if re.search(r'[.,]\d{2}$', digits):
+        whole, fraction = digits[:-3], digits[-2:]
+        return float(re.sub(r'[.,]', '', whole) + '.' + fraction)
+    return int(re.sub(r'[.,]', '', digits))
+
+
+def extract(prefix):
+    """Pull '<prefix>.*.price' strings out of the catalogs into the price table"""
+    with open(PRICES_PATH, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    known = {p.get('messageKey'): pid for pid, p in data['prices'].items()}
+    catalogs = {loc: Catalog.load(loc) for loc in LOCALES}
+    added, drift = 0, []
+    for key, text in catalogs[DEFAULT_LOCALE].items(prefix):
+        if not key.endswith('.price') or not isinstance(text, str):
+            continue
+        amount = parse_amount(text)
+        if amount is None:
+            continue
+        for loc, cat in catalogs.items():
+            other = cat.get(key)
+            if isinstance(other, str) and parse_amount(other) != amount:
+                drift.append(f"{key}: {DEFAULT_LOCALE}={text!r} {loc}={other!r}")
+        if key not in known:
+            pid = key[:-len('.price')]
+            data['prices'][pid] = {'amount': amount, 'currency': 'EUR', 'messageKey': key}
+            added += 1
+    if added:
+        with open(PRICES_PATH, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+    return added, drift
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['extract']:
+        parser = argparse.ArgumentParser(prog='build_prices.py extract')
+        parser.add_argument('prefix', help='catalog namespace to scan, e.g. taxAdvisory.services')
+        args = parser.parse_args(argv[1:])
+        added, drift = extract(args.prefix)
+        for line in drift:
+            print(f"⚠️  drift: {line}")
+        print(f"✅ {added} price(s) added to {relpath(PRICES_PATH)}")
+        return 0
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--check', action='store_true', help='do not write; fail if stale')
+    args = parser.parse_args(argv)
+
+    prices = load_prices()
+    output = render_ts(prices, target_locales())
+    stale = []
+
+    try:
+        with open(OUTPUT_PATH, 'r', encoding='utf-8') as f:
+            current = f.read()
+    except OSError:
+        current = None
+    if current != output:
+        stale.append(relpath(OUTPUT_PATH))
+        if not args.check:
+            with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
+                f.write(output)
+
+    for locale in LOCALES:
+        wanted = {p['messageKey']: format_price(locale, pid, prices)
+                  for pid, p in prices.items() if p.get('messageKey')}
+        cat = Catalog.load(locale)
+        changed = {k: v for k, v in wanted.items() if cat.get(k) != v}
+        if not changed:
+            continue
+        stale.append(f"messages/{locale}.json ({len(changed)} price message(s))")
+        if not args.check:
+            def sync(catalog, changed=changed):
+                for key, value in changed.items():
+                    set_path(catalog, key, value)
+            update_catalog(locale, sync, message='build_prices.py')
+
+    print(f"💶 {len(prices)} prices × {len(target_locales())} locales")
+    for item in stale:
+        print(f"   {'❌ stale' if args.check else '✏️  updated'}: {item}")
+    if not stale:
+        print("✅ Prices are up to date")
+    return 1 if args.check and stale else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
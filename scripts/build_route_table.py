@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Generate a precompiled, bidirectional localized route table from the
+`pathnames` in i18n/routing.ts.
+
+Writes i18n/routes.generated.ts with, for each locale:
+  - a hashed map internal → localized and localized → internal pathname
+    (exact lookups cost O(path length))
+  - a segment trie for pathnames with dynamic `[param]` segments
+
+and checks that every pathname has a matching app/[locale]/.../page.tsx.
+
+middleware.ts uses the table to redirect internal slugs to their localized
+form with one lookup before handing the request to next-intl. The npm
+prebuild step runs `--check`, so a stale table fails the build.
+
+Usage:
+    python3 scripts/build_route_table.py           # regenerate + check pages
+    python3 scripts/build_route_table.py --check   # fail if out of date (CI)
+"""
+import argparse
+import json
+import os
+import re
+import sys
+
+from i18n_common import ROOT_DIR, relpath
+
+ROUTING_PATH = os.path.join(ROOT_DIR, 'i18n', 'routing.ts')
+OUTPUT_PATH = os.path.join(ROOT_DIR, 'i18n', 'routes.generated.ts')
+APP_LOCALE_DIR = os.path.join(ROOT_DIR, 'app', '[locale]')
+
+COMMENT_RE = re.compile(r'/\*.*?\*/|//[^\n]*', re.S)
+STRING = r"""(?:'([^']*)'|"([^"]*)")"""
+LOCALES_RE = re.compile(r'\blocales\s*:\s*\[([^\]]*)\]')
+ENTRY_RE = re.compile(STRING + r'\s*:\s*(?:' + STRING + r'|\{([^{}]*)\})')
+LOCALE_ENTRY_RE = re.compile(r"""['"]?([\w-]+)['"]?\s*:\s*""" + STRING)
+
+
+def _block_after(source, label):
+    """Return the text inside the braces following `label:`"""
+    match = re.search(r'\b%s\s*:\s*\{' % label, source)
+    if not match:
+        raise ValueError(f"'{label}' not found in {relpath(ROUTING_PATH)}")
+    depth, start = 1, match.end()
+    for i in range(start, len(source)):
+        if source[i] == '{':
+            depth += 1
+        elif source[i] == '}':
+            depth -= 1
+            if depth == 0:
+                return source[start:i]
+    raise ValueError(f"unbalanced braces after '{label}'")
+
+
+def parse_routing(path=ROUTING_PATH):
+    """Parse locales and pathnames out of i18n/routing.ts → (locales, {internal: {locale: localized}})"""
+    with open(path, 'r', encoding='utf-8') as f:
+        source = COMMENT_RE.sub('', f.read())
+    locales = re.findall(STRING, LOCALES_RE.search(source).group(1))
+    locales = [a or b for a, b in locales]
+
+    pathnames = {}
+    for m in ENTRY_RE.finditer(_block_after(source, 'pathnames')):
+        internal = m.group(1) or m.group(2)
+        if m.group(5) is not None:
+            per_locale = {loc: (a or b) for loc, a, b in LOCALE_ENTRY_RE.findall(m.group(5))}
+            missing = [loc for loc in locales if loc not in per_locale]
+            if missing:
+                raise ValueError(f"pathname '{internal}' has no entry for {missing}")
+        else:
+            per_locale = {loc: m.group(3) or m.group(4) for loc in locales}
+        pathnames[internal] = per_locale
+    return locales, pathnames
+
+
+def split_path(pathname):
+    """'/a/[id]/b' → ['a', '[id]', 'b']"""
+    return [s for s in pathname.split('/') if s]
+
+
+def build_trie(routes):
+    """
+    Build a segment trie from {pattern: target}. Nodes are
+    {'s': {segment: node}, 'p': node, 'r': [pattern, target]}.
+    """
+    root = {}
+    for pattern, target in sorted(routes.items()):
+        node = root
+        for segment in split_path(pattern):
+            if segment.startswith('['):
+                node = node.setdefault('p', {})
+            else:
+                node = node.setdefault('s', {}).setdefault(segment, {})
+        node['r'] = [pattern, target]
+    return root
+
+
+def build_tables(locales, pathnames):
+    """Compute forward/reverse maps and dynamic tries per locale"""
+    localized = {loc: {} for loc in locales}
+    internal = {loc: {} for loc in locales}
+    errors = []
+    for route, per_locale in pathnames.items():
+        for loc in locales:
+            target = per_locale[loc]
+            if target in internal[loc] and internal[loc][target] != route:
+                errors.append(f"[{loc}] '{target}' is claimed by both "
+                              f"'{internal[loc][target]}' and '{route}'")
+            localized[loc][route] = target
+            internal[loc][target] = route
+
+    tries = {}
+    for loc in locales:
+        dynamic_out = {k: v for k, v in localized[loc].items() if '[' in k}
+        dynamic_in = {k: v for k, v in internal[loc].items() if '[' in k}
+        if dynamic_out or dynamic_in:
+            tries[loc] = {'toLocalized': build_trie(dynamic_out),
+                          'toInternal': build_trie(dynamic_in)}
+    return {'locales': locales, 'localized': localized, 'internal': internal,
+            'tries': tries}, errors
+
+
+def app_routes(base=APP_LOCALE_DIR):
+    """Set of route patterns served by app/[locale]/**/page.tsx (route groups removed)"""
+    routes = set()
+    for dirpath, _, filenames in os.walk(base):
+        if not any(name in filenames for name in ('page.tsx', 'page.ts', 'page.jsx', 'page.js')):
+            continue
+        segments = [s for s in split_path(os.path.relpath(dirpath, base).replace(os.sep, '/'))
+                    if s != '.' and not (s.startswith('(') and s.endswith(')'))]
+        routes.add('/' + '/'.join(segments))
+    return routes
+
+
+def check_pages(pathnames, routes):
+    """Return internal pathnames with no matching page"""
+    def normalize(pattern):
+        return '/' + '/'.join('[]' if s.startswith('[') else s for s in split_path(pattern))
+
+    available = {normalize(r) for r in routes}
+    return [p for p in pathnames if normalize(p) not in available]
+
+
+def render_ts(tables):
+    """Render the TypeScript module"""
+    def js(value):
+        return json.dumps(value, indent=2, ensure_ascii=False, sort_keys=True)
+
+    return f"""// Generated by scripts/build_route_table.py from i18n/routing.ts.
+// Do not edit by hand: run `python3 scripts/build_route_table.py`.
+
+type RouteNode = {{ s?: Record<string, RouteNode>; p?: RouteNode; r?: [string, string] }};
+
+export const routeLocales = {js(tables['locales'])} as const;
+
+/** internal pathname → localized pathname, per locale */
+export const localizedPathnames: Record<string, Record<string, string>> = {js(tables['localized'])};
+
+/** localized pathname → internal pathname, per locale */
+export const internalPathnames: Record<string, Record<string, string>> = {js(tables['internal'])};
+
+/** Segment tries for pathnames with dynamic [param] segments */
+const dynamicRoutes: Record<string, {{ toLocalized: RouteNode; toInternal: RouteNode }}> = {js(tables['tries'])};
+
+function matchTrie(root: RouteNode, pathname: string): string | undefined {{
+  const segments = pathname.split('/').filter(Boolean);
+  const values: string[] = [];
+  let node: RouteNode = root;
+  for (const segment of segments) {{
+    const next: RouteNode | undefined = node.s?.[segment];
+    if (next) {{
+      node = next;
+    }} else if (node.p) {{
+      values.push(segment);
+      node = node.p;
+    }} else {{
+      return undefined;
+    }}
+  }}
+  if (!node.r) return undefined;
+  let i = 0;
+  return node.r[1].replace(/\\[[^\\]]+\\]/g, () => values[i++]);
+}}
+
+/** Map an internal pathname (e.g. '/open-account') to its localized form */
+export function toLocalizedPathname(locale: string, pathname: string): string {{
+  const exact = localizedPathnames[locale]?.[pathname];
+  if (exact !== undefined) return exact;
+  const trie = dynamicRoutes[locale];
+  return (trie && matchTrie(trie.toLocalized, pathname)) ?? pathname;
+}}
+
+/** Map a localized pathname (e.g. '/ouvrir-compte') back to the internal route */
+export function toInternalPathname(locale: string, pathname: string): string {{
+  const exact = internalPathnames[locale]?.[pathname];
+  if (exact !== undefined) return exact;
+  const trie = dynamicRoutes[locale];
+  return (trie && matchTrie(trie.toInternal, pathname)) ?? pathname;
+}}
+"""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--check', action='store_true',
+                        help='do not write; fail if the generated table is stale')
+    args = parser.parse_args(argv)
+
+    print("🗺️  Building localized route table...")
+    locales, pathnames = parse_routing()
+    tables, errors = build_tables(locales, pathnames)
+    missing = check_pages(pathnames, app_routes())
+    for route in missing:
+        errors.append(f"'{route}' has no page under app/[locale]/")
+
+    output = render_ts(tables)
+    print(f"   Locales: {', '.join(locales)}")
+    print(f"   Pathnames: {len(pathnames)} ({sum(1 for p in pathnames if '[' in p)} dynamic)")
+
+    status = 0
+    if args.check:
+        try:
+            with open(OUTPUT_PATH, 'r', encoding='utf-8') as f:
+                current = f.read()
+        except OSError:
+            current = None
+        if current != output:
+            errors.append(f"{relpath(OUTPUT_PATH)} is out of date")
+    else:
+        with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
+            f.write(output)
+        print(f"   Written to {relpath(OUTPUT_PATH)}")
+
+    for error in errors:
+        print(f"❌ {error}")
+        status = 1
+    if not status:
+        print("✅ Route table is valid")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,106 @@
+/**
+ * Locked, version-stamped catalog writes for the Node translation scripts.
+ *
+ * Same protocol as scripts/i18n_common.py: an O_EXCL lock file at
+ * messages/<locale>.json.lock, a compare-and-swap on the file's SHA-1, and
+ * a version bump in messages/<locale>.meta.json. Every write is recorded
+ * in the catalog history (scripts/catalog_history.py) while the lock is
+ * held, preceded by a "before" snapshot if the files on disk were never
+ * recorded. Scripts writing several locales take a rollback point first.
+ */
+import { spawnSync } from 'child_process';
+import { createHash } from 'crypto';
+import { closeSync, existsSync, openSync, readFileSync, renameSync, statSync, unlinkSync, writeFileSync, writeSync } from 'fs';
+import { hostname } from 'os';
+import { basename } from 'path';
+
+const STALE_AFTER_MS = 120_000;
+const TIMEOUT_MS = 30_000;
+
+const catalogPath = (locale) => `messages/${locale}.json`;
+const metaPath = (locale) => `messages/${locale}.meta.json`;
+const sha1 = (data) => createHash('sha1').update(data).digest('hex');
+const sleep = (ms) => Atomics.wait(new Int32Array(new SharedArrayBuffer(4)), 0, 0, ms);
+
+/** Read a catalog together with the SHA-1 it was read at */
+export function readCatalog(locale) {
+  const data = readFileSync(catalogPath(locale));
+  return { catalog: JSON.parse(data.toString('utf8')), sha1: sha1(data) };
+}
+
+function withLock(locale, fn) {
+  const lockPath = `${catalogPath(locale)}.lock`;
+  const deadline = Date.now() + TIMEOUT_MS;
+  let fd;
+  for (;;) {
+    try {
+      fd = openSync(lockPath, 'wx');
+      break;
+    } catch (err) {
+      if (err.code !== 'EEXIST') throw err;
+      try {
+        if (Date.now() - statSync(lockPath).mtimeMs > STALE_AFTER_MS) {
+          unlinkSync(lockPath);
+          continue;
+        }
+      } catch {
+        continue;
+      }
+      if (Date.now() > deadline) throw new Error(`could not lock ${lockPath}`);
+      sleep(50 + Math.random() * 100);
+    }
+  }
+  try {
+    writeSync(fd, `${process.pid} ${hostname()}\n`);
+    closeSync(fd);
+    return fn();
+  } finally {
+    try { unlinkSync(lockPath); } catch {}
+  }
+}
+
+function recordSnapshot(message, locale) {
+  const result = spawnSync(
+    'python3',
+    ['scripts/catalog_history.py', 'record', '-m', message, ...(locale ? ['--locale', locale] : [])],
+    { stdio: ['ignore', 'pipe', 'inherit'], encoding: 'utf8' }
+  );
+  if (result.status !== 0) {
+    console.warn(`⚠️  "${message}" not recorded in the catalog history`);
+    return undefined;
+  }
+  return /Snapshot (\w+)/.exec(result.stdout)?.[1];
+}
+
+/**
+ * Snapshot the catalogs before a run that writes several of them and print
+ * how to undo it; returns the snapshot id.
+ */
+export function recordRollbackPoint(message = basename(process.argv[1] ?? 'node')) {
+  const id = recordSnapshot(`before ${message}`);
+  if (id) console.log(`📸 Undo this run with \`python3 scripts/catalog_history.py restore ${id}\``);
+  return id;
+}
+
+/**
+ * Write a catalog if it has not changed since `expectedSha1` was read.
+ * Throws (and writes nothing) if another writer got in first.
+ */
+export function writeCatalog(locale, catalog, expectedSha1, message = basename(process.argv[1] ?? 'node')) {
+  const data = Buffer.from(JSON.stringify(catalog, null, 2), 'utf8');
+  return withLock(locale, () => {
+    const path = catalogPath(locale);
+    const current = existsSync(path) ? sha1(readFileSync(path)) : '';
+    if (expectedSha1 !== undefined && current !== expectedSha1) {
+      throw new Error(`${path} changed since it was read - re-run this script`);
+    }
+    recordSnapshot(`before ${message}`, locale);
+    let version = 0;
+    try { version = JSON.parse(readFileSync(metaPath(locale), 'utf8')).version ?? 0; } catch {}
+    writeFileSync(`${path}.${process.pid}.tmp`, data);
+    renameSync(`${path}.${process.pid}.tmp`, path);
+    writeFileSync(metaPath(locale), JSON.stringify({ version: version + 1, sha1: sha1(data) }, null, 2) + '\n');
+    recordSnapshot(message, locale);
+    return version + 1;
+  });
+}
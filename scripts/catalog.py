@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Trie-backed message catalog.
+
+`Catalog` stores a nested messages/*.json tree as a trie of compact
+`__slots__` nodes, one per namespace segment. Dotted-key get/set/delete
+cost O(depth), flattened iteration is lazy, subtree views share nodes with
+their parent instead of copying, and every node caches a content hash that
+is invalidated along the write path, so diffs skip unchanged subtrees.
+
+    cat = Catalog.load('fr')
+    cat['nav.home']                      # O(depth) lookup
+    cat['nav.newKey'] = 'Nouveau'         # creates parents as needed
+    for key, value in cat.subtree('taxAdvisory').items(): ...
+    for key, old, new in Catalog.load('en').diff(cat): ...
+"""
+import hashlib
+import json
+
+from i18n_common import load_catalog
+
+_MISSING = object()
+
+
+class _Node:
+    """A namespace (``children`` is a dict) or a message (``value`` is set)"""
+
+    __slots__ = ('children', 'value', 'digest')
+
+    def __init__(self, value=_MISSING):
+        self.children = None if value is not _MISSING else {}
+        self.value = value
+        self.digest = None
+
+    @classmethod
+    def build(cls, tree):
+        if not isinstance(tree, dict):
+            return cls(tree)
+        node = cls()
+        for key, value in tree.items():
+            node.children[key] = cls.build(value)
+        return node
+
+    def hash(self):
+        if self.digest is None:
+            h = hashlib.sha1()
+            if self.children is None:
+                h.update(b'v' + json.dumps(self.value, ensure_ascii=False).encode('utf-8'))
+            else:
+                for key in sorted(self.children):
+                    h.update(b'k' + key.encode('utf-8') + b'\0' + self.children[key].hash().encode())
+            self.digest = h.hexdigest()
+        return self.digest
+
+
+class Catalog:
+    """Nested message catalog with dotted-key access"""
+
+    __slots__ = ('_root', '_prefix', '_ancestors')
+
+    def __init__(self, tree=None):
+        self._root = _Node.build(tree if tree is not None else {})
+        if self._root.children is None:
+            raise TypeError('a catalog must be a JSON object')
+        self._prefix = ''
+        self._ancestors = ()
+
+    @classmethod
+    def load(cls, locale):
+        """Load messages/<locale>.json"""
+        return cls(load_catalog(locale))
+
+    @classmethod
+    def _view(cls, node, prefix, ancestors):
+        view = cls.__new__(cls)
+        view._root, view._prefix, view._ancestors = node, prefix, ancestors
+        return view
+
+    # -- lookups -----------------------------------------------------------
+
+    def _walk(self, key):
+        """Return the path of nodes from the root to ``key`` (None if absent)"""
+        path = [self._root]
+        node = self._root
+        for part in key.split('.') if key else ():
+            if node.children is None or part not in node.children:
+                return None
+            node = node.children[part]
+            path.append(node)
+        return path
+
+    def get(self, key, default=None):
+        """Message at ``key``; namespaces are returned as subtree views"""
+        path = self._walk(key)
+        if path is None:
+            return default
+        node = path[-1]
+        if node.children is None:
+            return node.value
+        return self._view(node, self._join(key), self._ancestors + tuple(path[:-1]))
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self._walk(key) is not None
+
+    def is_message(self, key):
+        path = self._walk(key)
+        return path is not None and path[-1].children is None
+
+    def subtree(self, key):
+        """Live view of the namespace at ``key`` (no copy); KeyError if absent"""
+        view = self.get(key, _MISSING)
+        if not isinstance(view, Catalog):
+            raise KeyError(f"'{key}' is not a namespace")
+        return view
+
+    def _join(self, key):
+        return f'{self._prefix}.{key}' if self._prefix and key else (self._prefix or key)
+
+    # -- updates -----------------------------------------------------------
+
+    def _invalidate(self, path):
+        for node in self._ancestors:
+            node.digest = None
+        for node in path:
+            node.digest = None
+
+    def set(self, key, value):
+        """Assign a message (or a whole dict subtree), creating parents as needed"""
+        parts = key.split('.')
+        node = self._root
+        path = [node]
+        for i, part in enumerate(parts[:-1]):
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _Node()
+            elif child.children is None:
+                raise ValueError(f"'{'.'.join(parts[:i + 1])}' is a message, not a namespace")
+            node = child
+            path.append(node)
+        node.children[parts[-1]] = _Node.build(value)
+        self._invalidate(path)
+
+    __setitem__ = set
+
+    def delete(self, key):
+        """Remove a message or namespace"""
+        path = self._walk(key)
+        if path is None or len(path) < 2:
+            raise KeyError(key)
+        del path[-2].children[key.rsplit('.', 1)[-1]]
+        self._invalidate(path[:-1])
+
+    __delitem__ = delete
+
+    # -- iteration ---------------------------------------------------------
+
+    def items(self, prefix=''):
+        """Lazily yield (dotted_key, message) pairs, depth-first in file order"""
+        path = self._walk(prefix)
+        if path is None:
+            return
+        node, base = path[-1], self._join(prefix)
+        if node.children is None:
+            yield base, node.value
+            return
+        stack = [(base, iter(node.children.items()))]
+        while stack:
+            base, it = stack[-1]
+            for name, node in it:
+                key = f'{base}.{name}' if base else name
+                if node.children is None:
+                    yield key, node.value
+                else:
+                    stack.append((key, iter(node.children.items())))
+                    break
+            else:
+                stack.pop()
+
+    def keys(self, prefix=''):
+        return (key for key, _ in self.items(prefix))
+
+    def __iter__(self):
+        return self.keys()
+
+    def __len__(self):
+        """Number of messages (walks the tree)"""
+        return sum(1 for _ in self.items())
+
+    def namespaces(self):
+        """Top-level names directly under this catalog/view"""
+        return list(self._root.children)
+
+    # -- change detection --------------------------------------------------
+
+    def digest(self, key=''):
+        """Content hash of a message or namespace, cached until it changes"""
+        path = self._walk(key)
+        if path is None:
+            raise KeyError(key)
+        return path[-1].hash()
+
+    def diff(self, other):
+        """
+        Yield (dotted_key, old, new) for every message that differs from
+        ``other`` (missing side is None). Subtrees with equal hashes are skipped.
+        """
+        yield from _diff_nodes(self._root, other._root, self._prefix)
+
+    # -- conversion --------------------------------------------------------
+
+    def to_dict(self):
+        """Nested dict in original key order (copies)"""
+        return _to_dict(self._root)
+
+    def __repr__(self):
+        return f'<Catalog {self._prefix or "(root)"}: {len(self._root.children)} namespaces>'
+
+
+def _to_dict(node):
+    if node.children is None:
+        return node.value
+    return {key: _to_dict(child) for key, child in node.children.items()}
+
+
+def _leaves(node, base):
+    if node.children is None:
+        yield base, node.value
+        return
+    for name, child in node.children.items():
+        yield from _leaves(child, f'{base}.{name}' if base else name)
+
+
+def _diff_nodes(a, b, base):
+    if a.hash() == b.hash():
+        return
+    if a.children is None or b.children is None:
+        if a.children is None and b.children is None:
+            yield base, a.value, b.value
+            return
+        old, new = dict(_leaves(a, base)), dict(_leaves(b, base))
+        for key in list(old) + [k for k in new if k not in old]:
+            if old.get(key) != new.get(key):
+                yield key, old.get(key), new.get(key)
+        return
+    for name in list(a.children) + [n for n in b.children if n not in a.children]:
+        key = f'{base}.{name}' if base else name
+        left, right = a.children.get(name), b.children.get(name)
+        if left is None:
+            for k, v in _leaves(right, key):
+                yield k, None, v
+        elif right is None:
+            for k, v in _leaves(left, key):
+                yield k, v, None
+        else:
+            yield from _diff_nodes(left, right, key)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Content-addressed history of the message catalogs.
+
+Every write is recorded as a snapshot: each top-level namespace of each
+locale is stored once as a zlib-compressed object named by its SHA-1, and
+a snapshot is just a manifest of namespace → object hashes. Namespaces
+that did not change are shared between snapshots, so the store grows with
+what actually changed instead of with the full catalog size.
+
+Store layout (.i18n-history/):
+    objects/ab/cdef...   namespace or manifest objects
+    log.jsonl            one line per snapshot: id, time, message
+
+Writers snapshot while they hold the catalog lock, so the log is in write
+order. If the files on disk no longer match the latest snapshot (a hand
+edit, a write from before the history existed), a "before <message>"
+snapshot of that state is taken ahead of the write, so the pre-write state
+can always be restored.
+
+A script that writes several locales logs one snapshot per write. Each
+script records its rollback point before the run and prints the id to
+restore; `~N` counts every write, including restores, so it only undoes
+a run that wrote a single catalog.
+
+Usage:
+    python3 scripts/catalog_history.py record -m "before FR import" [--locale de]
+    python3 scripts/catalog_history.py list
+    python3 scripts/catalog_history.py diff ~1 latest
+    python3 scripts/catalog_history.py restore <id> [--locale fr]
+
+Snapshot references are a (prefix of a) snapshot id, `latest`, or `~N`
+for the Nth snapshot before the latest one.
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+import zlib
+
+from catalog import Catalog
+from i18n_common import LOCALES, ROOT_DIR, catalog_lock, catalog_path, sha1_bytes, write_catalog_locked
+
+HISTORY_DIR = os.environ.get('I18N_HISTORY_DIR', os.path.join(ROOT_DIR, '.i18n-history'))
+
+
+def _object_path(digest):
+    return os.path.join(HISTORY_DIR, 'objects', digest[:2], digest[2:])
+
+
+def put_object(value):
+    """Store a JSON value, returning its content hash (no-op if already stored)"""
+    data = json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    digest = sha1_bytes(data)
+    path = _object_path(digest)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(zlib.compress(data, 6))
+        os.replace(tmp, path)
+    return digest
+
+
+def get_object(digest):
+    """Load a stored JSON value by hash"""
+    with open(_object_path(digest), 'rb') as f:
+        return json.loads(zlib.decompress(f.read()).decode('utf-8'))
+
+
+def read_log():
+    """All snapshot log entries, oldest first"""
+    try:
+        with open(os.path.join(HISTORY_DIR, 'log.jsonl'), 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except OSError:
+        return []
+
+
+def record_snapshot(message='', catalogs=None, locales=()):
+    """
+    Snapshot the given {locale: catalog}; by default every catalog in
+    messages/ for LOCALES, ``locales`` and the locales of the latest
+    snapshot. Returns the snapshot id; nothing is logged if it equals the
+    latest one, or if there is no catalog to snapshot (None is returned).
+    Writers call this while holding the catalog lock.
+    """
+    log = read_log()
+    if catalogs is None:
+        wanted = set(LOCALES) | set(locales)
+        if log:
+            wanted |= set(get_object(log[-1]['id']))
+        catalogs = {}
+        for locale in sorted(wanted):
+            try:
+                with open(catalog_path(locale), 'r', encoding='utf-8') as f:
+                    catalogs[locale] = json.load(f)
+            except FileNotFoundError:
+                continue
+
+    if not catalogs:
+        return None
+    manifest = {locale: [[ns, put_object(value)] for ns, value in catalog.items()]
+                for locale, catalog in sorted(catalogs.items())}
+    snapshot_id = put_object(manifest)
+
+    if log and log[-1]['id'] == snapshot_id:
+        return snapshot_id
+    os.makedirs(HISTORY_DIR, exist_ok=True)
+    with open(os.path.join(HISTORY_DIR, 'log.jsonl'), 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'id': snapshot_id, 'time': int(time.time()),
+                            'message': message}, ensure_ascii=False) + '\n')
+    return snapshot_id
+
+
+def resolve(ref, log=None):
+    """Resolve `latest`, `~N` or an id prefix to a full snapshot id"""
+    log = read_log() if log is None else log
+    if not log:
+        raise ValueError('no snapshots recorded yet')
+    if ref in ('latest', 'HEAD'):
+        return log[-1]['id']
+    if ref.startswith('~'):
+        back = int(ref[1:] or 1)
+        if back >= len(log):
+            raise ValueError(f"only {len(log)} snapshot(s) recorded")
+        return log[-1 - back]['id']
+    matches = {entry['id'] for entry in log if entry['id'].startswith(ref)}
+    if len(matches) != 1:
+        raise ValueError(f"'{ref}' matches {len(matches)} snapshots")
+    return matches.pop()
+
+
+def load_snapshot(snapshot_id, locales=None):
+    """Rebuild {locale: catalog} from a snapshot, preserving namespace order"""
+    manifest = get_object(snapshot_id)
+    return {locale: {ns: get_object(digest) for ns, digest in entries}
+            for locale, entries in manifest.items()
+            if locales is None or locale in locales}
+
+
+def diff_snapshots(old_id, new_id):
+    """
+    Compare two snapshots → {locale: {namespace: {'added', 'removed', 'changed'}}}.
+    Only namespaces whose object hash differs are loaded and compared.
+    """
+    old, new = get_object(old_id), get_object(new_id)
+    result = {}
+    for locale in sorted(set(old) | set(new)):
+        a, b = dict(old.get(locale, [])), dict(new.get(locale, []))
+        changes = {}
+        for ns in sorted(set(a) | set(b)):
+            if a.get(ns) == b.get(ns):
+                continue
+            old_ns = Catalog({ns: get_object(a[ns])} if ns in a else {})
+            new_ns = Catalog({ns: get_object(b[ns])} if ns in b else {})
+            keys = changes[ns] = {'added': [], 'removed': [], 'changed': []}
+            for key, before, after in old_ns.diff(new_ns):
+                name = 'added' if before is None else 'removed' if after is None else 'changed'
+                keys[name].append(key)
+        if changes:
+            result[locale] = changes
+    return result
+
+
+def restore_snapshot(snapshot_id, locales=None):
+    """
+    Write a snapshot back to messages/*.json. All restored locales are
+    locked and written together and recorded as a single snapshot.
+    """
+    catalogs = load_snapshot(snapshot_id, locales)
+    message = f'restore {snapshot_id[:10]}'
+    with contextlib.ExitStack() as stack:
+        for locale in sorted(catalogs):
+            stack.enter_context(catalog_lock(locale))
+        record_snapshot(f'before {message}', locales=catalogs)
+        for locale, catalog in catalogs.items():
+            write_catalog_locked(locale, catalog)
+        record_snapshot(message, locales=catalogs)
+    return sorted(catalogs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('record', help='snapshot the current catalogs')
+    p.add_argument('-m', '--message', default='manual snapshot')
+    p.add_argument('--locale', action='append', default=[],
+                   help='also snapshot a locale outside LOCALES')
+    p = sub.add_parser('list', help='list snapshots, newest first')
+    p.add_argument('-n', type=int, default=20)
+    p = sub.add_parser('diff', help='show changed keys between two snapshots')
+    p.add_argument('old')
+    p.add_argument('new', nargs='?', default='latest')
+    p = sub.add_parser('restore', help='write a snapshot back to messages/')
+    p.add_argument('ref')
+    p.add_argument('--locale', action='append')
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'record':
+            snapshot_id = record_snapshot(args.message, locales=args.locale)
+            print(f"📸 Snapshot {snapshot_id[:10]} recorded" if snapshot_id
+                  else "No catalogs to snapshot yet")
+        elif args.command == 'list':
+            log = read_log()
+            for back, entry in enumerate(reversed(log[-args.n:])):
+                when = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['time']))
+                print(f"~{back:<3} {entry['id'][:10]}  {when}  {entry['message']}")
+            if not log:
+                print("No snapshots recorded yet")
+        elif args.command == 'diff':
+            log = read_log()
+            changes = diff_snapshots(resolve(args.old, log), resolve(args.new, log))
+            for locale, namespaces in changes.items():
+                for ns, keys in namespaces.items():
+                    print(f"[{locale}] {ns}: +{len(keys['added'])} -{len(keys['removed'])} "
+                          f"~{len(keys['changed'])}")
+                    for mark, name in (('+', 'added'), ('-', 'removed'), ('~', 'changed')):
+                        for key in keys[name]:
+                            print(f"   {mark} {key}")
+            if not changes:
+                print("No differences")
+        elif args.command == 'restore':
+            snapshot_id = resolve(args.ref)
+            restored = restore_snapshot(snapshot_id, args.locale)
+            print(f"✅ Restored {', '.join(restored)} from snapshot {snapshot_id[:10]}")
+    except (ValueError, OSError) as e:
+        print(f"❌ {e}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
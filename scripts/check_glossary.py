@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Check that regulated terms (ACPR, AMF, KYC/AML, GDPR/RGPD, product names...)
+are translated consistently across the message catalogs.
+
+The glossary in i18n/glossary.json is compiled into one Aho-Corasick
+automaton for the source terms and one per target locale, so every EN/FR
+pair is scanned in a single pass no matter how many terms the glossary has.
+
+Usage:
+    python3 scripts/check_glossary.py                # check all non-default locales
+    python3 scripts/check_glossary.py --locale fr --json
+"""
+import argparse
+import json
+import os
+import sys
+
+from aho_corasick import Automaton
+from catalog import Catalog
+from i18n_common import DEFAULT_LOCALE, LOCALES, ROOT_DIR
+
+GLOSSARY_PATH = os.path.join(ROOT_DIR, 'i18n', 'glossary.json')
+
+
+def load_glossary(path=GLOSSARY_PATH):
+    """Load the glossary terms list"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['terms']
+
+
+def compile_glossary(terms, locale):
+    """
+    Build (source_automaton, target_automaton) for one locale.
+
+    Both automata match case-insensitively; case-sensitive source terms are
+    re-checked against the original text so 'AMF' does not match 'amf'.
+    Target matches yield the index of the term they satisfy.
+    """
+    source = Automaton(ignore_case=True)
+    target = Automaton(ignore_case=True)
+    for index, term in enumerate(terms):
+        if locale not in term['targets']:
+            continue
+        source.add(term['source'], index)
+        for approved in term['targets'][locale]:
+            target.add(approved, index)
+    return source.build(), target.build()
+
+
+def check_pairs(pairs, terms, source, target):
+    """
+    Scan (key, source_text, target_text) pairs and yield violations as
+    (key, term_index, source_text, target_text).
+    """
+    for key, text, translated in pairs:
+        found = set()
+        for start, end, index in source.iter(text):
+            term = terms[index]
+            if term.get('ignoreCase') or text[start:end] == term['source']:
+                found.add(index)
+        if not found:
+            continue
+        satisfied = target.find_all(translated)
+        for index in sorted(found - satisfied):
+            yield key, index, text, translated
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--locale', action='append', help='target locale(s) to check (default: all)')
+    parser.add_argument('--glossary', default=GLOSSARY_PATH, help='glossary JSON file')
+    parser.add_argument('--json', action='store_true', help='print violations as JSON')
+    args = parser.parse_args(argv)
+
+    terms = load_glossary(args.glossary)
+    base = Catalog.load(DEFAULT_LOCALE)
+    locales = args.locale or [l for l in LOCALES if l != DEFAULT_LOCALE]
+
+    report = {}
+    for locale in locales:
+        translated = Catalog.load(locale)
+        source, target = compile_glossary(terms, locale)
+        pairs = ((key, text, translated.get(key)) for key, text in base.items()
+                 if isinstance(text, str) and translated.is_message(key))
+        report[locale] = [
+            {'key': key, 'term': terms[index]['source'],
+             'expected': terms[index]['targets'][locale],
+             'source': text, 'translation': value}
+            for key, index, text, value in check_pairs(pairs, terms, source, target)
+        ]
+
+    total = sum(len(v) for v in report.values())
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(f"📖 Glossary check ({len(terms)} terms)")
+        for locale, violations in report.items():
+            print(f"\n   [{locale}] {len(violations)} inconsistent translation(s)")
+            for v in violations:
+                print(f"   ❌ {v['key']}: '{v['term']}' → expected one of {v['expected']}")
+                print(f"      {v['translation'][:100]}")
+        print()
+        print("✅ Terminology is consistent" if not total else f"⚠️  {total} issue(s) found")
+    return 1 if total else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Find hard-coded UI text in app/[locale]/ and components/ that never made it
+into messages/*.json, and propose namespaced keys for it.
+
+Files are parsed in a process pool and results are cached per file in
+.i18n-cache/, so a rescan only reparses sources that actually changed.
+
+Usage:
+    python3 scripts/extract_strings.py                 # report + write proposals
+    python3 scripts/extract_strings.py --merge         # also merge into en.json
+    python3 scripts/extract_strings.py --jobs 4 --output extracted.json
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import unicodedata
+
+from i18n_common import (
+    DEFAULT_LOCALE, ROOT_DIR, flatten, get_path, iter_source_files, load_catalog,
+    cached_per_file, set_path, update_catalog,
+)
+
+CACHE_NAME = 'extract_strings.json'
+CACHE_VERSION = 3
+
+# Props whose string literal values are shown to the user
+TEXT_PROPS = ('placeholder', 'title', 'alt', 'aria-label', 'label', 'description')
+
+# Text after a JSX opening/closing tag or fragment. The `>` must close a tag
+# (attributes may contain arrow functions), so comparisons such as
+# `length > 0 ? a : b` are not mistaken for text.
+JSX_TEXT_RE = re.compile(
+    r'(?:<\/?[A-Za-z][\w.:-]*(?:\s(?:[^<>]|=>)*?)?\/?|<)(?<!=)>\s*([^<>{}]+?)\s*(?=<|\{)'
+)
+PROP_RE = re.compile(r'\b(%s)\s*=\s*"([^"]+)"' % '|'.join(re.escape(p) for p in TEXT_PROPS))
+COMMENT_RE = re.compile(r'/\*.*?\*/|^\s*//[^\n]*', re.S | re.M)
+LETTER_RE = re.compile(r'[A-Za-zÀ-ÿ]')
+# Words of an ASCII-folded string, splitting camel/PascalCase: 'PPFamilyStep' -> PP, Family, Step
+WORD_RE = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+')
+
+
+def looks_like_copy(text):
+    """Heuristic: is this literal something a user would read?"""
+    if len(text) < 2 or not LETTER_RE.search(text):
+        return False
+    if text.startswith(('http', '/', '#', '@', '.')) or '=>' in text or '&&' in text:
+        return False
+    # Single identifiers (ids, css tokens, enum values) are not copy
+    if ' ' not in text and not text[0].isupper():
+        return False
+    if re.fullmatch(r'[A-Z0-9_\-]+', text) and len(text) <= 6:
+        return False  # acronyms like "BIC", "EUR"
+    if text[0] in ',&|)(' or text.endswith('$'):
+        return False
+    if any(token in text for token in (';', '`', ' = ', '==', '||', '()', 'React.', '.displayName')):
+        return False  # leaked code between generics/arrow functions
+    return True
+
+
+def extract_file(path):
+    """Return [[line, kind, text], ...] of hard-coded UI strings in one source file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    # Blank out comments but keep line numbers stable
+    source = COMMENT_RE.sub(lambda m: re.sub(r'[^\n]', ' ', m.group(0)), source)
+
+    found = []
+    seen = set()
+    for kind, regex, group in (('text', JSX_TEXT_RE, 1), ('prop', PROP_RE, 2)):
+        for match in regex.finditer(source):
+            text = ' '.join(match.group(group).split())
+            if not looks_like_copy(text):
+                continue
+            line = source.count('\n', 0, match.start(group)) + 1
+            if (line, text) in seen:
+                continue
+            seen.add((line, text))
+            found.append([line, kind, text])
+    found.sort()
+    return found
+
+
+def namespace_for(rel):
+    """
+    Derive a catalog namespace from a source path.
+
+    app/[locale]/tax-advisory/booking/BookingClient.tsx -> taxAdvisory.booking
+    components/accounting/doc-upload.tsx                -> components.accounting.docUpload
+    """
+    parts = rel.split('/')
+    if parts[0] == 'app':
+        parts = [p for p in parts[2:-1] if not p.startswith(('(', '['))] or ['home']
+    else:
+        parts = parts[:-1] + [os.path.splitext(parts[-1])[0]]
+    return '.'.join(camel_case(p) for p in parts)
+
+
+def ascii_fold(text):
+    """'Société à responsabilité' -> 'Societe a responsabilite'; apostrophes are dropped"""
+    text = re.sub(r"['\u2019]", '', text)
+    decomposed = unicodedata.normalize('NFKD', text)
+    return decomposed.encode('ascii', 'ignore').decode('ascii')
+
+
+def camel_case(text, max_words=5):
+    """
+    ASCII camelCase key segment:
+    'Select legal form' -> 'selectLegalForm', 'ClientTypeStep' -> 'clientTypeStep',
+    "Company's experience" -> 'companysExperience', 'Français' -> 'francais'
+    """
+    words = WORD_RE.findall(ascii_fold(text))[:max_words] or ['text']
+    head, *tail = [w.lower() for w in words]
+    key = head + ''.join(w[:1].upper() + w[1:] for w in tail)
+    return ('k' + key) if key[0].isdigit() else key
+
+
+def propose_keys(results, existing):
+    """Build {key: english_text} proposals, reusing keys whose value already matches"""
+    by_value = {}
+    for key, value in existing.items():
+        if isinstance(value, str):
+            by_value.setdefault(value, key)
+
+    proposals = {}
+    reused = {}
+    for rel in sorted(results):
+        namespace = namespace_for(rel)
+        for line, kind, text in results[rel]:
+            if text in by_value:
+                reused.setdefault(text, by_value[text])
+                continue
+            base = f'{namespace}.{camel_case(text)}'
+            key, n = base, 2
+            while (key in existing or key in proposals) and proposals.get(key) != text:
+                key, n = f'{base}{n}', n + 1
+            proposals[key] = text
+    return proposals, reused
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--output', default='.i18n-cache/extracted.en.json',
+                        help='where to write proposed keys (repo-relative; keep it out of messages/)')
+    parser.add_argument('--merge', action='store_true',
+                        help=f'merge proposals into messages/{DEFAULT_LOCALE}.json (never overwrites)')
+    args = parser.parse_args(argv)
+
+    print("🔍 Scanning sources for hard-coded strings...")
+    paths = [p for p in iter_source_files() if not p.endswith('.d.ts')]
+    results, reparsed = cached_per_file(CACHE_NAME, paths, extract_file,
+                                        version=CACHE_VERSION, jobs=args.jobs)
+    results = {rel: found for rel, found in results.items() if found}
+    print(f"   Files scanned: {len(paths)} ({reparsed} reparsed, {len(paths) - reparsed} cached)")
+
+    catalog = load_catalog(DEFAULT_LOCALE)
+    proposals, reused = propose_keys(results, flatten(catalog))
+    total = sum(len(found) for found in results.values())
+    print(f"   Hard-coded strings: {total} in {len(results)} files")
+    print(f"   Already in catalog (use existing key): {len(reused)}")
+    print(f"   New keys proposed: {len(proposals)}")
+
+    output = os.path.join(ROOT_DIR, args.output)
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'proposals': proposals,
+            'existing': reused,
+            'locations': results,
+        }, f, indent=2, ensure_ascii=False)
+    print(f"   Proposals written to {args.output}")
+
+    if args.merge:
+        def merge(catalog):
+            added = 0
+            for key, text in proposals.items():
+                if get_path(catalog, key) is not None:
+                    continue
+                try:
+                    set_path(catalog, key, text)
+                except ValueError as e:
+                    print(f"⚠️  Skipping {key}: {e}")
+                    continue
+                added += 1
+            return added
+
+        added = update_catalog(DEFAULT_LOCALE, merge, message='extract_strings.py --merge')
+        print(f"✅ Merged {added} keys into messages/{DEFAULT_LOCALE}.json")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the Opulanzbanking i18n tooling in scripts/
+
+All paths are resolved from the repository root, so the tools can be
+run from any working directory.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import random
+import socket
+import time
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+MESSAGES_DIR = os.path.join(ROOT_DIR, 'messages')
+CACHE_DIR = os.path.join(ROOT_DIR, '.i18n-cache')
+LOCALES = ['en', 'fr']
+DEFAULT_LOCALE = 'en'
+
+
+def catalog_path(locale):
+    """Path of the message catalog for a locale"""
+    return os.path.join(MESSAGES_DIR, f'{locale}.json')
+
+
+def load_catalog(locale):
+    """Load the nested message catalog for a locale"""
+    with open(catalog_path(locale), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_catalog(catalog):
+    """Serialize a catalog exactly the way add_translations.py writes it"""
+    return json.dumps(catalog, indent=2, ensure_ascii=False)
+
+
+class CatalogConflict(Exception):
+    """The catalog changed on disk between read and write"""
+
+
+def _meta_path(locale):
+    return os.path.join(MESSAGES_DIR, f'{locale}.meta.json')
+
+
+def read_stamp(locale):
+    """
+    Current (version, sha1) of a catalog. The hash is always taken from the
+    file itself, so writers that bypass the stamp are still detected.
+    """
+    try:
+        with open(_meta_path(locale), 'r', encoding='utf-8') as f:
+            version = json.load(f).get('version', 0)
+    except (OSError, ValueError):
+        version = 0
+    path = catalog_path(locale)
+    return version, file_sha1(path) if os.path.exists(path) else ''
+
+
+@contextlib.contextmanager
+def catalog_lock(locale, timeout=30.0, stale_after=120.0):
+    """
+    Advisory lock on messages/<locale>.json shared by every writer.
+
+    The lock is a messages/<locale>.json.lock file created with O_EXCL, so
+    Node scripts can take it too (fs.openSync(path, 'wx')). A lock older than
+    ``stale_after`` seconds is assumed to belong to a crashed writer.
+    """
+    path = catalog_path(locale) + '.lock'
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.stat(path).st_mtime > stale_after:
+                    os.unlink(path)
+                    continue
+            except FileNotFoundError:
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"could not lock {relpath(path)} within {timeout:.0f}s")
+            time.sleep(0.05 + random.random() * 0.1)
+    try:
+        os.write(fd, f'{os.getpid()} {socket.gethostname()}\n'.encode('utf-8'))
+        os.close(fd)
+        yield
+    finally:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def load_catalog_stamped(locale):
+    """
+    Load a catalog with the sha1 it was read at, for a later compare-and-swap
+    save. A locale without a catalog yet loads as ({}, '').
+    """
+    try:
+        with open(catalog_path(locale), 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return {}, ''
+    return json.loads(data.decode('utf-8')), sha1_bytes(data)
+
+
+def write_catalog_locked(locale, catalog, expected_sha1=None):
+    """
+    Write a catalog and bump its version stamp; the caller holds
+    catalog_lock(locale). Raises CatalogConflict if ``expected_sha1`` is
+    given and no longer matches the file.
+    """
+    data = dump_catalog(catalog).encode('utf-8')
+    version, current = read_stamp(locale)
+    if expected_sha1 is not None and current != expected_sha1:
+        raise CatalogConflict(f"messages/{locale}.json changed since it was read")
+    path = catalog_path(locale)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+    with open(_meta_path(locale), 'w', encoding='utf-8') as f:
+        json.dump({'version': version + 1, 'sha1': sha1_bytes(data)}, f, indent=2)
+        f.write('\n')
+    return version + 1
+
+
+def save_catalog(locale, catalog, message=None, expected_sha1=None):
+    """
+    Write the nested message catalog for a locale under the catalog lock,
+    bump its version stamp and snapshot it in the history.
+
+    With ``expected_sha1`` (from load_catalog_stamped) the write only
+    happens if nobody else wrote the file since it was read; otherwise
+    CatalogConflict is raised and nothing is written. If the catalogs on
+    disk were never snapshotted, that state is recorded first so the write
+    can be undone.
+    """
+    from catalog_history import record_snapshot
+
+    message = message or f'write {locale}.json'
+    with catalog_lock(locale):
+        # Snapshot the written locale too, even if it is not (yet) in LOCALES
+        record_snapshot(f'before {message}', locales=[locale])
+        version = write_catalog_locked(locale, catalog, expected_sha1)
+        record_snapshot(message, locales=[locale])
+    return version
+
+
+def update_catalog(locale, mutate, message=None, retries=8):
+    """
+    Optimistically apply ``mutate(catalog)`` and write the result.
+
+    The catalog is read without holding the lock; if another writer got in
+    first, the fresh catalog is re-read and ``mutate`` is applied again, so
+    concurrent jobs touching different namespaces both land. ``mutate`` may
+    return a value, which is passed back to the caller.
+    """
+    for attempt in range(retries):
+        catalog, sha1 = load_catalog_stamped(locale)
+        result = mutate(catalog)
+        try:
+            save_catalog(locale, catalog, message=message, expected_sha1=sha1)
+            return result
+        except CatalogConflict:
+            time.sleep(random.random() * 0.05 * (attempt + 1))
+    raise CatalogConflict(f"gave up on messages/{locale}.json after {retries} conflicting writes")
+
+
+def flatten(tree, prefix=''):
+    """Flatten a nested catalog into {'a.b.c': 'value'}"""
+    flat = {}
+    for key, value in tree.items():
+        path = f'{prefix}.{key}' if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+def unflatten(flat):
+    """Rebuild a nested catalog from dotted keys"""
+    tree = {}
+    for path, value in flat.items():
+        set_path(tree, path, value)
+    return tree
+
+
+def get_path(tree, path, default=None):
+    """Read a dotted key from a nested catalog"""
+    node = tree
+    for part in path.split('.'):
+        if not isinstance(node, dict) or part not in node:
+            return default
+        node = node[part]
+    return node
+
+
+def set_path(tree, path, value):
+    """Assign a dotted key in a nested catalog, creating parents as needed"""
+    parts = path.split('.')
+    node = tree
+    for i, part in enumerate(parts[:-1]):
+        child = node.get(part)
+        if child is None:
+            child = node[part] = {}
+        elif not isinstance(child, dict):
+            raise ValueError(f"'{'.'.join(parts[:i + 1])}' is a message, not a namespace")
+        node = child
+    node[parts[-1]] = value
+
+
+def sha1_bytes(data):
+    """Hex SHA-1 of raw bytes"""
+    return hashlib.sha1(data).hexdigest()
+
+
+def file_sha1(path):
+    """Hex SHA-1 of a file's contents"""
+    with open(path, 'rb') as f:
+        return sha1_bytes(f.read())
+
+
+def load_cache(name):
+    """Load a JSON cache file from .i18n-cache/, or {} if absent/corrupt"""
+    path = os.path.join(CACHE_DIR, name)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(name, data):
+    """Atomically write a JSON cache file into .i18n-cache/"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = os.path.join(CACHE_DIR, name)
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def relpath(path):
+    """Repository-relative path with forward slashes"""
+    return os.path.relpath(path, ROOT_DIR).replace(os.sep, '/')
+
+
+def iter_source_files(roots=('app/[locale]', 'components'), exts=('.tsx', '.ts')):
+    """Yield absolute paths of TS/TSX sources under the given repo-relative roots"""
+    for root in roots:
+        base = os.path.join(ROOT_DIR, root)
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames[:] = sorted(d for d in dirnames if d != 'node_modules')
+            for name in sorted(filenames):
+                if name.endswith(exts):
+                    yield os.path.join(dirpath, name)
+
+
+def cached_per_file(cache_name, paths, worker, version=1, jobs=None):
+    """
+    Run ``worker(path)`` for every path, reusing cached results per file.
+
+    Entries are keyed by repo-relative path and validated first by mtime,
+    then by content hash, so touching a file without changing it does not
+    trigger a reparse. Changed files are processed in a process pool.
+    Returns ({relpath: result}, number_of_reparsed_files).
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    cache = load_cache(cache_name)
+    if cache.get('version') != version:
+        cache = {'version': version, 'files': {}}
+    entries = cache['files']
+
+    results = {}
+    stale = []
+    for path in paths:
+        rel = relpath(path)
+        mtime = os.stat(path).st_mtime_ns
+        entry = entries.get(rel)
+        if entry and entry['mtime'] == mtime:
+            results[rel] = entry['result']
+            continue
+        digest = file_sha1(path)
+        if entry and entry['sha1'] == digest:
+            entry['mtime'] = mtime
+            results[rel] = entry['result']
+            continue
+        stale.append((path, rel, mtime, digest))
+
+    if stale:
+        if len(stale) == 1 or jobs == 1:
+            computed = [worker(path) for path, _, _, _ in stale]
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                computed = list(pool.map(worker, [s[0] for s in stale], chunksize=8))
+        for (path, rel, mtime, digest), result in zip(stale, computed):
+            entries[rel] = {'mtime': mtime, 'sha1': digest, 'result': result}
+            results[rel] = result
+
+    # Drop entries for files that no longer exist in the scanned set
+    for rel in list(entries):
+        if rel not in results:
+            del entries[rel]
+    save_cache(cache_name, cache)
+    return results, len(stale)
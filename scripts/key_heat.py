@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Aggregate runtime key-hit telemetry into key-heat statistics and use them to
+lay out the catalogs as a small hot "core" shard plus lazily loaded shards.
+
+lib/i18n-telemetry.ts appends sampled renders to .i18n-telemetry/*.jsonl:
+    {"ts": 1730000000, "route": "/tax-advisory", "locale": "en", "keys": {"a.b": 2}}
+
+`aggregate` streams the lines appended since its last run into
+i18n/key-heat.json (a byte offset per file is kept there, and a file that
+was rotated or truncated is read from the start). Previous statistics
+decay with the time elapsed since the last run (halved every
+``--half-life`` hours), so the layout follows current traffic however
+often aggregate runs. `shard` then
+fills a per-locale core shard with the hottest keys up to a byte budget and
+groups every other key by top-level namespace into lazy shards under
+messages/shards/<locale>/, with a manifest describing the layout.
+
+Usage:
+    python3 scripts/key_heat.py aggregate [files...] [--half-life 168]
+    python3 scripts/key_heat.py shard [--core-budget 16384]
+"""
+import argparse
+import glob
+import json
+import os
+import shutil
+import sys
+import time
+
+from catalog import Catalog
+from i18n_common import LOCALES, MESSAGES_DIR, ROOT_DIR, dump_catalog, relpath, unflatten
+
+TELEMETRY_GLOB = os.path.join(ROOT_DIR, '.i18n-telemetry', '*.jsonl')
+HEAT_PATH = os.path.join(ROOT_DIR, 'i18n', 'key-heat.json')
+SHARDS_DIR = os.path.join(MESSAGES_DIR, 'shards')
+CORE_SHARD = 'core'
+HALF_LIFE_HOURS = 7 * 24
+
+
+def load_heat(path=HEAT_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except OSError:
+        return {'updated': None, 'renders': 0, 'keys': {}, 'offsets': {}}
+
+
+def _new_lines(path, position):
+    """
+    Yield complete lines of ``path`` after a saved {'inode', 'offset'}
+    position, updating it in place. A partial last line is left for the next
+    run; a rotated or truncated file is read from the start.
+    """
+    st = os.stat(path)
+    if position.get('inode') != st.st_ino or st.st_size < position.get('offset', 0):
+        position.update(inode=st.st_ino, offset=0)
+    with open(path, 'rb') as f:
+        f.seek(position['offset'])
+        for line in f:
+            if not line.endswith(b'\n'):
+                break  # still being written
+            position['offset'] += len(line)
+            yield line
+
+
+def aggregate(paths, heat, half_life=HALF_LIFE_HOURS, now=None):
+    """
+    Fold new telemetry lines into ``heat`` in place. Existing hits first
+    decay by the time since ``heat['updated']``, halving every ``half_life``
+    hours; each key tracks its hit count and the routes it was rendered on.
+    Lines folded in by an earlier run are skipped. Returns the number of
+    lines read.
+    """
+    now = int(time.time()) if now is None else now
+    keys = heat['keys']
+    if heat.get('updated') is not None:
+        decay = 0.5 ** (max(now - heat['updated'], 0) / (half_life * 3600))
+        for stats in keys.values():
+            stats['hits'] = round(stats['hits'] * decay, 3)
+        heat['renders'] = round(heat.get('renders', 0) * decay, 3)
+    offsets = heat.setdefault('offsets', {})
+
+    lines = 0
+    for path in paths:
+        position = offsets.setdefault(relpath(os.path.abspath(path)), {})
+        for line in _new_lines(path, position):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # torn write from a crashed server
+            lines += 1
+            heat['renders'] += 1
+            route = record.get('route', '?')
+            for key, count in record.get('keys', {}).items():
+                stats = keys.setdefault(key, {'hits': 0, 'routes': []})
+                stats['hits'] += count
+                if route not in stats['routes']:
+                    stats['routes'].append(route)
+
+    # Forget rotated-away files and keys whose heat has decayed to nothing
+    for name in [n for n in offsets if not os.path.exists(os.path.join(ROOT_DIR, n))]:
+        del offsets[name]
+    for key in [k for k, s in keys.items() if s['hits'] < 0.01]:
+        del keys[key]
+    heat['updated'] = now
+    return lines
+
+
+def _size(key, value):
+    """Approximate bytes a message adds to an indented shard file"""
+    depth = key.count('.') + 1
+    leaf = json.dumps({key.rsplit('.', 1)[-1]: value}, ensure_ascii=False, indent=2)
+    return len(leaf.encode('utf-8')) + 2 * depth - 2
+
+
+def shard_bytes(flat):
+    """Exact size of a shard as written by write_shards"""
+    return len(dump_catalog(unflatten(flat)).encode('utf-8'))
+
+
+def plan_shards(catalog, heat, core_budget):
+    """
+    Split a Catalog into {'core': {key: value}, namespace: {key: value}, ...}.
+    Keys enter the core in descending heat order until the byte budget is
+    spent; the serialized core is then measured and its coldest keys are
+    dropped until it really fits. Returns (shards, core_bytes).
+    """
+    hits = {k: s['hits'] for k, s in heat['keys'].items()}
+    messages = list(catalog.items())
+    ranked = sorted((m for m in messages if hits.get(m[0], 0) > 0),
+                    key=lambda m: hits[m[0]], reverse=True)
+
+    core = {}
+    used = 0
+    for key, value in ranked:
+        size = _size(key, value)
+        if used + size > core_budget:
+            break
+        core[key] = value
+        used += size
+    # The estimate ignores shared namespace braces; trim by the actual size
+    used = shard_bytes(core)
+    while core and used > core_budget:
+        coldest = next(reversed(core))
+        del core[coldest]
+        used = shard_bytes(core)
+
+    shards = {CORE_SHARD: core}
+    for key, value in messages:
+        if key not in core:
+            shards.setdefault(key.split('.', 1)[0], {})[key] = value
+    return shards, used
+
+
+def write_shards(locale, shards, heat):
+    """Write nested shard files and a manifest for one locale"""
+    out_dir = os.path.join(SHARDS_DIR, locale)
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.makedirs(out_dir)
+
+    manifest = {'core': f'{CORE_SHARD}.json', 'lazy': {}, 'bytes': {}}
+    for name, flat in shards.items():
+        data = dump_catalog(unflatten(flat))
+        with open(os.path.join(out_dir, f'{name}.json'), 'w', encoding='utf-8') as f:
+            f.write(data)
+        manifest['bytes'][name] = len(data.encode('utf-8'))
+        if name != CORE_SHARD:
+            manifest['lazy'][name] = f'{name}.json'
+
+    total = sum(s['hits'] for s in heat['keys'].values()) or 1
+    covered = sum(heat['keys'][k]['hits'] for k in shards[CORE_SHARD] if k in heat['keys'])
+    manifest['coreKeys'] = len(shards[CORE_SHARD])
+    manifest['coreHitCoverage'] = round(covered / total, 4)
+    with open(os.path.join(out_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('aggregate', help='merge telemetry JSONL into i18n/key-heat.json')
+    p.add_argument('files', nargs='*', help=f'default: {relpath(TELEMETRY_GLOB)}')
+    p.add_argument('--half-life', type=float, default=HALF_LIFE_HOURS,
+                   help='hours after which previous statistics count half')
+    p = sub.add_parser('shard', help='build heat-based catalog shards')
+    p.add_argument('--core-budget', type=int, default=16384, help='max bytes in the core shard')
+    args = parser.parse_args(argv)
+
+    if args.command == 'aggregate':
+        paths = args.files or sorted(glob.glob(TELEMETRY_GLOB))
+        heat = load_heat()
+        lines = aggregate(paths, heat, args.half_life)
+        with open(HEAT_PATH, 'w', encoding='utf-8') as f:
+            json.dump(heat, f, indent=2, ensure_ascii=False, sort_keys=True)
+            f.write('\n')
+        print(f"🔥 {lines} sampled renders from {len(paths)} file(s) → {len(heat['keys'])} hot keys")
+        print(f"   Written to {relpath(HEAT_PATH)}")
+        return 0
+
+    heat = load_heat()
+    if not heat['keys']:
+        print("⚠️  No key-heat statistics yet - run `key_heat.py aggregate` first; "
+              "every key will go to a lazy shard")
+    print(f"🧩 Sharding catalogs (core budget {args.core_budget} bytes)...")
+    for locale in LOCALES:
+        shards, _ = plan_shards(Catalog.load(locale), heat, args.core_budget)
+        manifest = write_shards(locale, shards, heat)
+        print(f"   [{locale}] core: {manifest['coreKeys']} keys, {manifest['bytes'][CORE_SHARD]} bytes, "
+              f"{manifest['coreHitCoverage']:.1%} of hits; {len(manifest['lazy'])} lazy shards")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Per-route translation coverage: for every page under app/[locale]/, count
+the message keys it references (including its layouts and every component it
+imports) that are present, fell back, or are missing in each locale.
+
+A base locale falls back to the default locale. A regional overlay
+(i18n/overlays.json) is evaluated from its delta in messages/overlays/ plus
+its base locale, so it does not need to be resolved first: a key in either
+is present, and only a key found in neither but in the default locale
+counts as a fallback.
+
+Key sets are extracted per file and cached in .i18n-cache/, and each route's
+result is cached by a fingerprint of its key set plus the hashes of the
+catalog namespaces it touches. After an edit only the changed files are
+reparsed, and only routes whose keys or namespaces changed are re-evaluated.
+
+Usage:
+    python3 scripts/route_coverage.py                       # JSON + HTML report
+    python3 scripts/route_coverage.py --locale fr-LU        # include a regional overlay
+    python3 scripts/route_coverage.py --fail-on-missing     # CI gate
+"""
+import argparse
+import html
+import json
+import os
+import re
+import sys
+
+from build_overlays import load_config, load_overlay
+from catalog import Catalog
+from i18n_common import (
+    DEFAULT_LOCALE, LOCALES, ROOT_DIR, cached_per_file, catalog_path, iter_source_files,
+    load_cache, relpath, save_cache, sha1_bytes,
+)
+
+FILES_CACHE = 'route_coverage.files.json'
+ROUTES_CACHE = 'route_coverage.routes.json'
+CACHE_VERSION = 4
+
+SOURCE_ROOTS = ('app/[locale]', 'components', 'features', 'shared', 'lib', 'contexts')
+ROUTES_ROOT = os.path.join(ROOT_DIR, 'app', '[locale]')
+
+BINDING_RE = re.compile(
+    r'\b(?:const|let)\s+(\w+)\s*=\s*(?:await\s+)?(?:useTranslations|getTranslations)\(\s*'
+    r'(?:[\'"]([^\'"]*)[\'"]|\{[^}]*?namespace:\s*[\'"]([^\'"]*)[\'"][^}]*\})?'
+)
+IMPORT_RE = re.compile(r'(?:\bfrom\s*|\bimport\s*\(?\s*)[\'"]((?:@/|\.\.?/)[^\'"]+)[\'"]')
+COMMENT_RE = re.compile(r'/\*.*?\*/|^\s*//[^\n]*', re.S | re.M)
+RESOLVE_EXTS = ('.tsx', '.ts', '/index.tsx', '/index.ts')
+
+
+def _resolve_import(spec, importer):
+    if spec.startswith('@/'):
+        base = os.path.join(ROOT_DIR, spec[2:])
+    else:
+        base = os.path.normpath(os.path.join(os.path.dirname(importer), spec))
+    for candidate in [base] + [base + ext for ext in RESOLVE_EXTS]:
+        if os.path.isfile(candidate) and candidate.endswith(('.ts', '.tsx')):
+            return relpath(candidate)
+    return None
+
+
+def scan_file(path):
+    """
+    Message keys referenced by one source file:
+    {'keys': [...], 'dynamic': [...], 'imports': [...]}.
+    ``dynamic`` holds the static prefix of template-literal keys.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        source = COMMENT_RE.sub('', f.read())
+
+    keys, dynamic = set(), set()
+    bindings = list(BINDING_RE.finditer(source))
+    for i, match in enumerate(bindings):
+        name, namespace = match.group(1), match.group(2) or match.group(3) or ''
+        prefix = f'{namespace}.' if namespace else ''
+        # Components often rebind `t` to another namespace; a binding holds
+        # until the next binding of the same name
+        end = next((b.start() for b in bindings[i + 1:] if b.group(1) == name), len(source))
+        call_re = re.compile(r'\b%s(?:\.rich|\.markup|\.raw|\.has)?\(\s*(?:([\'"])([^\'"]+)\1|`([^`]*)`)'
+                             % re.escape(name))
+        for call in call_re.finditer(source, match.end(), end):
+            if call.group(2):
+                keys.add(prefix + call.group(2))
+            elif '${' in call.group(3):
+                dynamic.add(prefix + call.group(3).split('${', 1)[0].rstrip('.'))
+            else:
+                keys.add(prefix + call.group(3))
+
+    imports = {_resolve_import(spec, path) for spec in IMPORT_RE.findall(source)}
+    return {'keys': sorted(keys), 'dynamic': sorted(dynamic),
+            'imports': sorted(i for i in imports if i)}
+
+
+def discover_routes():
+    """{route_path: [page and layout files, repo-relative]} for app/[locale]/"""
+    routes = {}
+    for dirpath, dirnames, filenames in os.walk(ROUTES_ROOT):
+        dirnames.sort()
+        if 'page.tsx' not in filenames:
+            continue
+        rel = os.path.relpath(dirpath, ROUTES_ROOT)
+        segments = [] if rel == '.' else rel.split(os.sep)
+        # Route groups such as (auth) do not appear in the URL
+        route = '/' + '/'.join(s for s in segments if not (s.startswith('(') and s.endswith(')')))
+        entry = [relpath(os.path.join(dirpath, 'page.tsx'))]
+        for depth in range(len(segments), -1, -1):
+            layout = os.path.join(ROUTES_ROOT, *segments[:depth], 'layout.tsx')
+            if os.path.exists(layout):
+                entry.append(relpath(layout))
+        routes[route] = entry
+    return routes
+
+
+def route_keys(entry_files, scans):
+    """Union of keys and dynamic prefixes over the import closure of a route"""
+    keys, dynamic, seen = set(), set(), set()
+    stack = list(entry_files)
+    while stack:
+        rel = stack.pop()
+        if rel in seen or rel not in scans:
+            continue
+        seen.add(rel)
+        scan = scans[rel]
+        keys.update(scan['keys'])
+        dynamic.update(scan['dynamic'])
+        stack.extend(scan['imports'])
+    return sorted(keys), sorted(dynamic), len(seen)
+
+
+def _namespace_digest(catalog, namespace):
+    try:
+        return catalog.digest(namespace)
+    except KeyError:
+        return '-'
+
+
+def load_locales(locales):
+    """
+    Returns ({locale: Catalog}, {locale: {'inherits': [...], 'fallback': [...]}})
+    for the reported locales plus the locales they inherit from or fall back
+    to. Overlays load as their delta and inherit their base.
+    """
+    try:
+        overlays = load_config()
+    except OSError:
+        overlays = {}
+    catalogs, chains = {}, {}
+    pending = list(locales)
+    while pending:
+        locale = pending.pop(0)
+        if locale in catalogs:
+            continue
+        if locale in overlays:
+            base = overlays[locale]['base']
+            catalogs[locale] = load_overlay(locale)
+            chains[locale] = {'inherits': [base],
+                              'fallback': [DEFAULT_LOCALE] if base != DEFAULT_LOCALE else []}
+        elif os.path.exists(catalog_path(locale)):
+            catalogs[locale] = Catalog.load(locale)
+            chains[locale] = {'inherits': [],
+                              'fallback': [] if locale == DEFAULT_LOCALE else [DEFAULT_LOCALE]}
+        else:
+            raise ValueError(f"messages/{locale}.json does not exist and '{locale}' "
+                             f"is not an overlay in i18n/overlays.json")
+        pending += chains[locale]['inherits'] + chains[locale]['fallback']
+    return catalogs, chains
+
+
+def evaluate(keys, dynamic, catalogs, chains, locales):
+    """{locale: {'present', 'fallback', 'missing', 'missingKeys', 'fallbackKeys'}}"""
+    result = {}
+    for locale in locales:
+        own = [catalogs[loc] for loc in [locale] + chains[locale]['inherits']]
+        fallbacks = [catalogs[loc] for loc in chains[locale]['fallback']]
+        present, fallback, missing = [], [], []
+        for key in keys:
+            if any(cat.is_message(key) for cat in own):
+                present.append(key)
+            elif any(cat.is_message(key) for cat in fallbacks):
+                fallback.append(key)
+            else:
+                missing.append(key)
+        # Dynamic keys cannot be resolved statically; only check their namespace exists
+        missing += [f'{prefix}.*' for prefix in dynamic
+                    if prefix and all(cat.get(prefix) is None for cat in own + fallbacks)]
+        result[locale] = {'present': len(present), 'fallback': len(fallback),
+                          'missing': len(missing), 'fallbackKeys': fallback,
+                          'missingKeys': missing}
+    return result
+
+
+def build_report(locales, jobs=None, force=False):
+    """Returns (report, files_reparsed, routes_recomputed)"""
+    paths = list(iter_source_files(SOURCE_ROOTS))
+    scans, reparsed = cached_per_file(FILES_CACHE, paths, scan_file,
+                                      version=CACHE_VERSION, jobs=jobs)
+    catalogs, chains = load_locales(locales)
+
+    cache = load_cache(ROUTES_CACHE)
+    if cache.get('version') != CACHE_VERSION or force:
+        cache = {'version': CACHE_VERSION, 'routes': {}}
+    cached = cache['routes']
+
+    routes, recomputed = {}, 0
+    for route, entry in sorted(discover_routes().items()):
+        keys, dynamic, n_files = route_keys(entry, scans)
+        namespaces = sorted({k.split('.', 1)[0] for k in keys + dynamic if k})
+        fingerprint = sha1_bytes(json.dumps([
+            keys, dynamic, locales, chains,
+            {loc: [_namespace_digest(cat, ns) for ns in namespaces] for loc, cat in catalogs.items()},
+        ], sort_keys=True).encode('utf-8'))
+        hit = cached.get(route)
+        if hit and hit['fingerprint'] == fingerprint:
+            routes[route] = hit['result']
+            continue
+        result = {'files': n_files, 'keys': len(keys), 'dynamic': len(dynamic),
+                  'locales': evaluate(keys, dynamic, catalogs, chains, locales)}
+        cached[route] = {'fingerprint': fingerprint, 'result': result}
+        routes[route] = result
+        recomputed += 1
+
+    for route in set(cached) - set(routes):
+        del cached[route]
+    save_cache(ROUTES_CACHE, cache)
+    return {'locales': list(locales), 'routes': routes}, reparsed, recomputed
+
+
+def render_html(report):
+    locales = report['locales']
+    head = ''.join(f'<th>{html.escape(loc)}</th>' for loc in locales)
+    rows = []
+    for route, data in report['routes'].items():
+        cells = []
+        for loc in locales:
+            stats = data['locales'][loc]
+            status = 'missing' if stats['missing'] else 'fallback' if stats['fallback'] else 'ok'
+            title = html.escape('\n'.join(stats['missingKeys'] + stats['fallbackKeys'][:20]))
+            cells.append(f'<td class="{status}" title="{title}">{stats["present"]}'
+                         f' / {stats["fallback"]} / {stats["missing"]}</td>')
+        rows.append(f'<tr><td>{html.escape(route)}</td><td>{data["keys"]}</td>{"".join(cells)}</tr>')
+    return f"""<!doctype html>
+<meta charset="utf-8">
+<title>Translation coverage by route</title>
+<style>
+body{{font:13px system-ui,sans-serif;margin:1.5rem}}
+table{{border-collapse:collapse}}
+th,td{{border:1px solid #ddd;padding:.25rem .5rem;text-align:right}}
+td:first-child{{text-align:left;font-family:monospace}}
+.ok{{background:#e7f6ec}}.fallback{{background:#fff6d6}}.missing{{background:#fde2e1}}
+</style>
+<p>Cells show present / fell back / missing keys. Hover a cell for the affected keys.</p>
+<table>
+<tr><th>Route</th><th>Keys</th>{head}</tr>
+{chr(10).join(rows)}
+</table>
+"""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--locale', action='append', default=[],
+                        help='extra locale(s) to report, e.g. a regional overlay')
+    parser.add_argument('--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--json', default='reports/i18n-coverage.json', help='JSON report path')
+    parser.add_argument('--html', default='reports/i18n-coverage.html', help='HTML report path')
+    parser.add_argument('--force', action='store_true', help='re-evaluate every route')
+    parser.add_argument('--fail-on-missing', action='store_true',
+                        help='exit 1 if any route has missing keys')
+    args = parser.parse_args(argv)
+
+    locales = list(LOCALES) + [loc for loc in args.locale if loc not in LOCALES]
+    try:
+        report, reparsed, recomputed = build_report(locales, jobs=args.jobs, force=args.force)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    for path, content in ((args.json, json.dumps(report, indent=2, ensure_ascii=False) + '\n'),
+                          (args.html, render_html(report))):
+        path = os.path.join(ROOT_DIR, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    routes = report['routes']
+    print(f"📊 {len(routes)} routes, {reparsed} file(s) reparsed, {recomputed} route(s) re-evaluated")
+    incomplete = 0
+    for locale in locales:
+        fallback = sum(1 for r in routes.values() if r['locales'][locale]['fallback'])
+        missing = sum(1 for r in routes.values() if r['locales'][locale]['missing'])
+        incomplete += missing
+        print(f"   [{locale}] {missing} route(s) with missing keys, {fallback} with fallbacks")
+    print(f"   Written to {args.json} and {args.html}")
+    return 1 if args.fail_on_missing and incomplete else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
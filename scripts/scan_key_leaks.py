@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Post-build gate: find message keys that leaked into the static export.
+
+When a message is missing, next-intl renders the raw key path (e.g.
+`investmentAdvisory.wizard.steps.review`) into the page. This scanner
+streams every rendered file under out/ through a worker pool and matches
+it against all flattened catalog keys with one prebuilt Aho-Corasick
+automaton, then reports leaked keys per route and locale.
+
+By default only rendered output (.html and the .txt RSC payloads) is
+scanned. With --include-js, JS chunks are scanned too; there a key that
+is a whole string literal (a compiled `t("a.b")` call) is not a leak.
+
+Usage:
+    python3 scripts/scan_key_leaks.py                  # scan out/
+    python3 scripts/scan_key_leaks.py --out-dir out --include-js --json
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from aho_corasick import Automaton
+from i18n_common import LOCALES, ROOT_DIR, flatten, load_catalog, relpath
+
+CHUNK_SIZE = 1 << 20
+RENDERED_EXTS = ('.html', '.txt')
+
+_automaton = None
+_max_len = 0
+
+
+def collect_keys(locales=LOCALES):
+    """Dotted message keys from all catalogs (single-segment keys are too ambiguous)"""
+    keys = set()
+    for locale in locales:
+        keys.update(k for k in flatten(load_catalog(locale)) if '.' in k)
+    return sorted(keys)
+
+
+def _init_worker(keys):
+    """Build the automaton once per worker process"""
+    global _automaton, _max_len
+    _automaton = Automaton(keys)
+    _max_len = max(map(len, keys), default=0)
+
+
+def _is_leak(buf, start, end, js):
+    """Filter matches that are only part of a longer dotted path, or code references"""
+    if start > 0 and buf[start - 1] == '.':
+        return False
+    if end + 1 < len(buf) and buf[end] == '.' and (buf[end + 1].isalnum() or buf[end + 1] == '_'):
+        return False
+    if js and start > 0 and end < len(buf) and buf[start - 1] in '"\'`' and buf[end] == buf[start - 1]:
+        return False
+    return True
+
+
+def scan_file(path):
+    """Stream one file in chunks and return {key: count} of leaked keys"""
+    js = path.endswith('.js')
+    found = {}
+    # A match is decided once the two characters after it are known (a
+    # following `.x` extends the path); keep enough context to re-match a
+    # deferred one and check the character before it
+    keep = _max_len + 2
+    tail, base, limit = '', 0, -1
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            eof = not chunk
+            buf = tail + chunk
+            for start, end, key in _automaton.iter(buf):
+                absolute_end = base + end
+                if absolute_end <= limit or (end >= len(buf) - 1 and not eof):
+                    continue  # already reported, or boundary not known yet
+                if _is_leak(buf, start, end, js):
+                    found[key] = found.get(key, 0) + 1
+            if eof:
+                return found
+            limit = base + len(buf) - 2
+            tail = buf[-keep:]
+            base += len(buf) - len(tail)
+
+
+def route_of(rel):
+    """'fr/tax-advisory/booking.html' → ('fr', '/tax-advisory/booking')"""
+    stem = os.path.splitext(rel)[0]
+    if stem.endswith('/index'):
+        stem = stem[:-len('/index')]
+    parts = stem.split('/')
+    if parts[0] in LOCALES:
+        return parts[0], '/' + '/'.join(parts[1:])
+    if parts[0] == '_next':
+        return '-', '/' + rel
+    return '-', '/' + stem if stem != 'index' else '/'
+
+
+def iter_files(out_dir, include_js):
+    exts = RENDERED_EXTS + (('.js',) if include_js else ())
+    for dirpath, dirnames, filenames in os.walk(out_dir):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.endswith(exts):
+                yield os.path.join(dirpath, name)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--out-dir', default='out', help='static export directory (repo-relative)')
+    parser.add_argument('--include-js', action='store_true', help='also scan JS chunks')
+    parser.add_argument('--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args(argv)
+
+    out_dir = os.path.join(ROOT_DIR, args.out_dir)
+    if not os.path.isdir(out_dir):
+        print(f"❌ {args.out_dir}/ not found - run `npm run build` first")
+        return 1
+
+    keys = collect_keys()
+    paths = list(iter_files(out_dir, args.include_js))
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker,
+                             initargs=(keys,)) as pool:
+        results = list(pool.map(scan_file, paths, chunksize=16))
+
+    report = {}
+    for path, found in zip(paths, results):
+        if not found:
+            continue
+        locale, route = route_of(os.path.relpath(path, out_dir).replace(os.sep, '/'))
+        entry = report.setdefault(locale, {}).setdefault(route, {})
+        for key, count in found.items():
+            entry[key] = entry.get(key, 0) + count
+
+    leaks = sum(len(keys) for routes in report.values() for keys in routes.values())
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False, sort_keys=True))
+    else:
+        print(f"🔎 Scanned {len(paths)} files in {relpath(out_dir)}/ against {len(keys)} keys")
+        for locale in sorted(report):
+            for route in sorted(report[locale]):
+                print(f"\n   [{locale}] {route}")
+                for key, count in sorted(report[locale][route].items()):
+                    print(f"   ❌ {key}" + (f" (x{count})" if count > 1 else ""))
+        print()
+        print("✅ No leaked message keys" if not leaks else f"⚠️  {leaks} leaked key(s) found")
+    return 1 if leaks else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,20 @@
+"""Shared fixtures; also makes the scripts/ modules importable the way the scripts import each other"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def messages_dir(tmp_path, monkeypatch):
+    """Point catalog reads, writes and the history store at a temp directory"""
+    import catalog_history
+    import i18n_common
+
+    messages = tmp_path / 'messages'
+    messages.mkdir()
+    monkeypatch.setattr(i18n_common, 'MESSAGES_DIR', str(messages))
+    monkeypatch.setattr(catalog_history, 'HISTORY_DIR', str(tmp_path / 'history'))
+    return messages
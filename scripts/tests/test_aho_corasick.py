@@ -0,0 +1,23 @@
+from aho_corasick import Automaton
+
+
+def test_overlapping_and_nested_matches():
+    automaton = Automaton(['he', 'she', 'his', 'hers'], whole_words=False)
+    assert sorted(automaton.iter('ushers')) == [(1, 4, 'she'), (2, 4, 'he'), (2, 6, 'hers')]
+    assert automaton.find_all('ahishers') == {'his', 'she', 'he', 'hers'}
+
+
+def test_whole_words():
+    automaton = Automaton(['nav.home', 'home'])
+    assert sorted(automaton.iter('nav.home homes home_ (home)')) == [
+        (0, 8, 'nav.home'), (4, 8, 'home'), (22, 26, 'home'),
+    ]
+    assert automaton.find_all('navnav.homex') == set()
+
+
+def test_ignore_case_and_values():
+    automaton = Automaton(ignore_case=True)
+    automaton.add('Booking', value='booking-key')
+    automaton.build()
+    assert list(automaton.iter('Book a BOOKING')) == [(7, 14, 'booking-key')]
+    assert len(automaton) == 1
@@ -0,0 +1,75 @@
+import pytest
+
+from catalog import Catalog
+
+
+def make():
+    return Catalog({
+        'nav': {'home': 'Home', 'about': 'About'},
+        'tax': {'title': 'Tax', 'services': {'price': '€100', 'vat': 'VAT'}},
+    })
+
+
+def test_get_set_delete():
+    cat = make()
+    assert cat['nav.home'] == 'Home'
+    assert cat.get('nav.missing') is None
+    assert 'tax.services' in cat and not cat.is_message('tax.services')
+
+    cat['nav.contact'] = 'Contact'
+    cat['new.deep.key'] = 'x'
+    assert cat['new.deep.key'] == 'x'
+    with pytest.raises(ValueError):
+        cat['nav.home.sub'] = 'y'
+
+    del cat['tax.services.vat']
+    assert 'tax.services.vat' not in cat
+    with pytest.raises(KeyError):
+        cat.delete('tax.services.vat')
+    assert list(cat.keys()) == ['nav.home', 'nav.about', 'nav.contact', 'tax.title',
+                                'tax.services.price', 'new.deep.key']
+
+
+def test_views_share_nodes_with_the_parent():
+    cat = make()
+    services = cat.subtree('tax.services')
+    assert dict(services.items()) == {'tax.services.price': '€100', 'tax.services.vat': 'VAT'}
+
+    services['price'] = '€120'
+    assert cat['tax.services.price'] == '€120'
+    with pytest.raises(KeyError):
+        cat.subtree('nav.home')
+
+
+def test_writes_through_a_view_invalidate_ancestor_hashes():
+    cat, other = make(), make()
+    root, tax, nav = cat.digest(), cat.digest('tax'), cat.digest('nav')
+    assert root == other.digest()
+
+    cat.subtree('tax.services')['vat'] = 'TVA'
+    assert cat.digest() != root
+    assert cat.digest('tax') != tax
+    assert cat.digest('nav') == nav
+
+    cat.subtree('tax.services')['vat'] = 'VAT'
+    assert cat.digest() == root
+
+
+def test_diff():
+    old, new = make(), make()
+    new['nav.home'] = 'Start'
+    new['nav.blog'] = 'Blog'
+    del new['tax.services']
+    assert sorted(old.diff(new)) == [
+        ('nav.blog', None, 'Blog'),
+        ('nav.home', 'Home', 'Start'),
+        ('tax.services.price', '€100', None),
+        ('tax.services.vat', 'VAT', None),
+    ]
+    assert list(old.diff(make())) == []
+
+
+def test_diff_message_replaced_by_namespace():
+    old, new = make(), make()
+    new['nav.home'] = {'title': 'Home'}
+    assert sorted(old.diff(new)) == [('nav.home', 'Home', None), ('nav.home.title', None, 'Home')]
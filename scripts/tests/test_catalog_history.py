@@ -0,0 +1,61 @@
+import json
+
+from catalog_history import diff_snapshots, read_log, record_snapshot, resolve, restore_snapshot
+from i18n_common import load_catalog, save_catalog
+
+
+def write_raw(messages_dir, locale, catalog):
+    (messages_dir / f'{locale}.json').write_text(json.dumps(catalog), encoding='utf-8')
+
+
+def test_record_restore_round_trip(messages_dir):
+    save_catalog('en', {'nav': {'home': 'Home'}, 'tax': {'title': 'Tax'}})
+    save_catalog('fr', {'nav': {'home': 'Accueil'}})
+    rollback = record_snapshot('before run')
+
+    save_catalog('en', {'nav': {'home': 'Start'}, 'tax': {'title': 'Tax'}})
+    save_catalog('fr', {'nav': {'home': 'Départ'}, 'new': {'key': 'x'}})
+    assert diff_snapshots(rollback, resolve('latest')) == {
+        'en': {'nav': {'added': [], 'removed': [], 'changed': ['nav.home']}},
+        'fr': {'nav': {'added': [], 'removed': [], 'changed': ['nav.home']},
+               'new': {'added': ['new.key'], 'removed': [], 'changed': []}},
+    }
+
+    assert restore_snapshot(rollback) == ['en', 'fr']
+    assert load_catalog('en') == {'nav': {'home': 'Home'}, 'tax': {'title': 'Tax'}}
+    assert load_catalog('fr') == {'nav': {'home': 'Accueil'}}
+    assert resolve('latest') == rollback
+
+    # Restoring the same snapshot again changes nothing and logs nothing
+    entries = len(read_log())
+    restore_snapshot(rollback)
+    assert len(read_log()) == entries
+
+
+def test_unrecorded_state_is_snapshotted_before_a_write(messages_dir):
+    save_catalog('en', {'nav': {'home': 'Home'}})
+    write_raw(messages_dir, 'en', {'nav': {'home': 'Hand edit'}})
+    save_catalog('en', {'nav': {'home': 'Scripted'}}, message='script')
+
+    assert [e['message'] for e in read_log()][-2:] == ['before script', 'script']
+    restore_snapshot(resolve('~1'))
+    assert load_catalog('en') == {'nav': {'home': 'Hand edit'}}
+
+
+def test_unchanged_catalogs_are_not_logged_twice(messages_dir):
+    save_catalog('en', {'a': {'b': 'c'}})
+    first = record_snapshot('manual')
+    assert record_snapshot('manual again') == first
+    assert [e['message'] for e in read_log()] == ['write en.json']
+
+
+def test_locales_outside_locales_are_kept(messages_dir):
+    save_catalog('en', {'a': {'b': 'c'}})
+    save_catalog('de', {'a': {'b': 'd'}})
+    snapshot = resolve('latest')
+    save_catalog('en', {'a': {'b': 'e'}})
+    write_raw(messages_dir, 'de', {'a': {'b': 'changed'}})
+
+    restore_snapshot(snapshot)
+    assert load_catalog('de') == {'a': {'b': 'd'}}
+    assert load_catalog('en') == {'a': {'b': 'c'}}
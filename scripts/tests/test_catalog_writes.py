@@ -0,0 +1,48 @@
+import json
+import threading
+
+import pytest
+
+from i18n_common import (
+    CatalogConflict, load_catalog, load_catalog_stamped, read_stamp, save_catalog, update_catalog,
+)
+
+
+def test_save_refuses_a_stale_read(messages_dir):
+    save_catalog('en', {'nav': {'home': 'Home'}})
+    catalog, sha1 = load_catalog_stamped('en')
+    save_catalog('en', {'nav': {'home': 'Start'}})
+
+    catalog['nav']['about'] = 'About'
+    with pytest.raises(CatalogConflict):
+        save_catalog('en', catalog, expected_sha1=sha1)
+    assert load_catalog('en') == {'nav': {'home': 'Start'}}
+    assert read_stamp('en')[0] == 2
+
+
+def test_concurrent_update_catalog_keeps_every_write(messages_dir):
+    save_catalog('en', {})
+    writers, rounds = 4, 5
+    errors = []
+
+    def writer(n):
+        try:
+            for i in range(rounds):
+                update_catalog('en', lambda c: c.setdefault(f'ns{n}', {}).update({f'k{i}': str(i)}),
+                               retries=100)
+        except Exception as e:  # surfaced below; pytest does not see thread exceptions
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    catalog = load_catalog('en')
+    assert catalog == {f'ns{n}': {f'k{i}': str(i) for i in range(rounds)} for n in range(writers)}
+    assert read_stamp('en')[0] == 1 + writers * rounds
+    assert not (messages_dir / 'en.json.lock').exists()
+    with open(messages_dir / 'en.meta.json', encoding='utf-8') as f:
+        assert json.load(f)['sha1'] == load_catalog_stamped('en')[1]
@@ -0,0 +1,23 @@
+import json
+
+from key_heat import aggregate
+
+
+def empty_heat():
+    return {'updated': None, 'renders': 0, 'keys': {}, 'offsets': {}}
+
+
+def test_decay_follows_elapsed_time_not_run_count(tmp_path):
+    log = tmp_path / 'a.jsonl'
+    log.write_text(json.dumps({'route': '/', 'keys': {'nav.home': 2}}) + '\n', encoding='utf-8')
+    heat = empty_heat()
+
+    assert aggregate([str(log)], heat, half_life=1, now=0) == 1
+    for _ in range(3):
+        assert aggregate([str(log)], heat, half_life=1, now=0) == 0
+    assert heat['keys']['nav.home']['hits'] == 2
+    assert heat['renders'] == 1
+
+    aggregate([str(log)], heat, half_life=1, now=2 * 3600)
+    assert heat['keys']['nav.home']['hits'] == 0.5
+    assert heat['renders'] == 0.25
@@ -0,0 +1,26 @@
+from catalog import Catalog
+from route_coverage import evaluate
+
+
+def test_overlay_counts_keys_inherited_from_its_base_as_present():
+    catalogs = {
+        'en': Catalog({'nav': {'home': 'Home', 'about': 'About', 'blog': 'Blog'}}),
+        'fr': Catalog({'nav': {'home': 'Accueil', 'about': 'À propos'}}),
+        'fr-LU': Catalog({'nav': {'about': 'À propos (LU)'}}),
+        'en-GB': Catalog({}),
+    }
+    chains = {
+        'en': {'inherits': [], 'fallback': []},
+        'fr': {'inherits': [], 'fallback': ['en']},
+        'fr-LU': {'inherits': ['fr'], 'fallback': ['en']},
+        'en-GB': {'inherits': ['en'], 'fallback': []},
+    }
+    keys = ['nav.home', 'nav.about', 'nav.blog', 'nav.missing']
+    result = evaluate(keys, ['nav', 'gone'], catalogs, chains, ['fr', 'fr-LU', 'en-GB'])
+
+    assert result['fr-LU'] == result['fr'] == {
+        'present': 2, 'fallback': 1, 'missing': 2,
+        'fallbackKeys': ['nav.blog'], 'missingKeys': ['nav.missing', 'gone.*'],
+    }
+    assert result['en-GB']['present'] == 3
+    assert result['en-GB']['fallback'] == 0
@@ -0,0 +1,45 @@
+import pytest
+
+import scan_key_leaks
+
+KEYS = ['taxAdvisory.services.corporate.price', 'nav.home']
+
+TEXTS = [
+    'x taxAdvisory.services.corporate.price.foo y',
+    'x taxAdvisory.services.corporate.price. y',
+    'x taxAdvisory.services.corporate.price',
+    'taxAdvisory.services.corporate.price.foo',
+    'a.nav.home nav.home.x <b>nav.home</b>',
+    'nav.home',
+]
+
+
+@pytest.fixture(autouse=True)
+def automaton():
+    scan_key_leaks._init_worker(KEYS)
+
+
+def scan(tmp_path, text, chunk_size, monkeypatch, name='page.html'):
+    path = tmp_path / name
+    path.write_text(text, encoding='utf-8')
+    monkeypatch.setattr(scan_key_leaks, 'CHUNK_SIZE', chunk_size)
+    return scan_key_leaks.scan_file(str(path))
+
+
+def test_whole_file_matches(tmp_path, monkeypatch):
+    assert scan(tmp_path, TEXTS[0], 1 << 20, monkeypatch) == {}
+    assert scan(tmp_path, TEXTS[1], 1 << 20, monkeypatch) == {'taxAdvisory.services.corporate.price': 1}
+    assert scan(tmp_path, TEXTS[4], 1 << 20, monkeypatch) == {'nav.home': 1}
+
+
+@pytest.mark.parametrize('text', TEXTS)
+def test_every_chunk_size_agrees_with_one_read(tmp_path, monkeypatch, text):
+    expected = scan(tmp_path, text, 1 << 20, monkeypatch)
+    for size in range(1, len(text) + 2):
+        assert scan(tmp_path, text, size, monkeypatch) == expected, f'chunk size {size}'
+
+
+def test_quoted_literal_in_js_is_not_a_leak(tmp_path, monkeypatch):
+    text = 'const a = t("nav.home"); b = `nav.home` + "nav.home!"'
+    for size in range(1, len(text) + 2):
+        assert scan(tmp_path, text, size, monkeypatch, 'chunk.js') == {'nav.home': 1}
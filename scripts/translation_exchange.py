@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Exchange translations with external translators as XLIFF 2.0 or CSV.
+
+Export writes only the keys a locale still needs: missing keys, and stale
+keys whose English source changed since the translation was imported
+(tracked by source hash in i18n/translation-state.json). Translations that
+did not come through an import (hand edits, add_translations.py) have no
+hash yet; export records their current source hash as the baseline, so a
+later change to the English text marks them stale. Output is
+written unit by unit, and import reads files incrementally (iterparse /
+csv reader), so memory stays bounded for multi-megabyte files. Imported
+units are validated in batches and merged into the catalog in one write.
+
+Usage:
+    python3 scripts/translation_exchange.py export fr --format xliff -o fr.xlf
+    python3 scripts/translation_exchange.py export de --all -o de.csv
+    python3 scripts/translation_exchange.py import fr fr.xlf
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape, quoteattr
+
+from catalog import Catalog
+from i18n_common import (
+    DEFAULT_LOCALE, ROOT_DIR, catalog_path, load_catalog, relpath, set_path, sha1_bytes,
+    update_catalog,
+)
+
+STATE_PATH = os.path.join(ROOT_DIR, 'i18n', 'translation-state.json')
+XLIFF_NS = 'urn:oasis:names:tc:xliff:document:2.0'
+CSV_HEADER = ['key', 'source', 'target', 'state']
+BATCH_SIZE = 500
+
+PLACEHOLDER_RE = re.compile(r'\{\s*(\w+)')
+TAG_RE = re.compile(r'</?(\w+)>')
+
+
+def source_hash(text):
+    return sha1_bytes(text.encode('utf-8'))[:12]
+
+
+def load_state():
+    """{locale: {key: source_hash}} recorded at import time"""
+    try:
+        with open(STATE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except OSError:
+        return {}
+
+
+def save_state(state):
+    with open(STATE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, ensure_ascii=False, sort_keys=True)
+        f.write('\n')
+
+
+def load_or_empty(locale):
+    return load_catalog(locale) if os.path.exists(catalog_path(locale)) else {}
+
+
+def record_baseline(locale):
+    """
+    Record the current source hash for every translated key of a locale
+    that has none yet. Returns the number of keys recorded.
+    """
+    source = Catalog.load(DEFAULT_LOCALE)
+    target = Catalog(load_or_empty(locale))
+    state = load_state()
+    hashes = state.setdefault(locale, {})
+    recorded = 0
+    for key, text in source.items():
+        if isinstance(text, str) and key not in hashes and isinstance(target.get(key), str):
+            hashes[key] = source_hash(text)
+            recorded += 1
+    if recorded:
+        save_state(state)
+    return recorded
+
+
+def pending_units(locale, include_all=False):
+    """Yield (key, source, current_target, state) for keys the locale still needs"""
+    source = Catalog.load(DEFAULT_LOCALE)
+    target = Catalog(load_or_empty(locale))
+    hashes = load_state().get(locale, {})
+    for key, text in source.items():
+        if not isinstance(text, str):
+            continue
+        current = target.get(key)
+        if not isinstance(current, str):
+            yield key, text, '', 'missing'
+        elif key in hashes and hashes[key] != source_hash(text):
+            yield key, text, current, 'stale'
+        elif include_all:
+            yield key, text, current, 'translated'
+
+
+def export_xliff(units, out, locale):
+    """Stream units as an XLIFF 2.0 document"""
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    out.write(f'<xliff xmlns="{XLIFF_NS}" version="2.0" srcLang="{DEFAULT_LOCALE}" '
+              f'trgLang={quoteattr(locale)}>\n  <file id="messages">\n')
+    count = 0
+    for key, source, target, state in units:
+        segment_state = 'initial' if state == 'missing' else 'translated'
+        out.write(f'    <unit id={quoteattr(key)}>\n'
+                  f'      <notes><note category="status">{state}</note></notes>\n'
+                  f'      <segment state="{segment_state}">\n'
+                  f'        <source>{escape(source)}</source>\n'
+                  f'        <target>{escape(target)}</target>\n'
+                  f'      </segment>\n    </unit>\n')
+        count += 1
+    out.write('  </file>\n</xliff>\n')
+    return count
+
+
+def export_csv(units, out):
+    """Stream units as CSV with a key,source,target,state header"""
+    writer = csv.writer(out)
+    writer.writerow(CSV_HEADER)
+    count = 0
+    for unit in units:
+        writer.writerow(unit)
+        count += 1
+    return count
+
+
+def read_xliff(path):
+    """Incrementally yield (key, target) from an XLIFF 2.0 file"""
+    unit_tag = f'{{{XLIFF_NS}}}unit'
+    target_tag = f'{{{XLIFF_NS}}}target'
+    parents = []
+    for event, elem in ET.iterparse(path, events=('start', 'end')):
+        if event == 'start':
+            parents.append(elem)
+            continue
+        parents.pop()
+        if elem.tag == unit_tag:
+            text = ''.join(''.join(t.itertext()) for t in elem.iter(target_tag))
+            yield elem.get('id'), text
+            parents[-1].remove(elem)  # drop processed units to keep memory flat
+
+
+def read_csv(path):
+    """Incrementally yield (key, target) from a CSV export"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header or header[:3] != CSV_HEADER[:3]:
+            raise ValueError(f"unexpected CSV header {header}, expected {CSV_HEADER}")
+        for row in reader:
+            if row:
+                yield row[0], row[2] if len(row) > 2 else ''
+
+
+def validate_batch(batch, source):
+    """Split a batch of (key, target) into (accepted, errors)"""
+    accepted, errors = [], []
+    for key, target in batch:
+        text = source.get(key)
+        if not isinstance(text, str):
+            errors.append(f"{key}: not in {DEFAULT_LOCALE}.json")
+        elif not target.strip():
+            continue  # left untranslated
+        elif sorted(PLACEHOLDER_RE.findall(text)) != sorted(PLACEHOLDER_RE.findall(target)):
+            errors.append(f"{key}: placeholders differ from source")
+        elif sorted(TAG_RE.findall(text)) != sorted(TAG_RE.findall(target)):
+            errors.append(f"{key}: rich-text tags differ from source")
+        else:
+            accepted.append((key, target))
+    return accepted, errors
+
+
+def import_file(locale, path, batch_size=BATCH_SIZE, dry_run=False):
+    """Validate and merge a translated file into messages/<locale>.json"""
+    reader = read_csv if path.endswith('.csv') else read_xliff
+    source = Catalog.load(DEFAULT_LOCALE)
+    accepted, errors, seen = [], [], 0
+
+    batch = []
+    for unit in reader(path):
+        batch.append(unit)
+        if len(batch) >= batch_size:
+            ok, bad = validate_batch(batch, source)
+            accepted += ok
+            errors += bad
+            seen += len(batch)
+            batch = []
+            print(f"   … {seen} units read, {len(accepted)} accepted, {len(errors)} rejected")
+    if batch:
+        ok, bad = validate_batch(batch, source)
+        accepted += ok
+        errors += bad
+        seen += len(batch)
+
+    if accepted and not dry_run:
+        def merge(catalog):
+            for key, target in accepted:
+                set_path(catalog, key, target)
+
+        update_catalog(locale, merge, message=f'import {os.path.basename(path)}')
+
+        state = load_state()
+        hashes = state.setdefault(locale, {})
+        for key, _ in accepted:
+            hashes[key] = source_hash(source[key])
+        save_state(state)
+    return seen, accepted, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('export', help='export missing/stale keys for a locale')
+    p.add_argument('locale')
+    p.add_argument('-o', '--output', required=True)
+    p.add_argument('--format', choices=['xliff', 'csv'],
+                   help='default: from the output extension')
+    p.add_argument('--all', action='store_true', help='export every key, not only pending ones')
+    p = sub.add_parser('import', help='merge a translated XLIFF/CSV file')
+    p.add_argument('locale')
+    p.add_argument('file')
+    p.add_argument('--dry-run', action='store_true', help='validate only')
+    args = parser.parse_args(argv)
+
+    if args.command == 'export':
+        fmt = args.format or ('csv' if args.output.endswith('.csv') else 'xliff')
+        recorded = record_baseline(args.locale)
+        if recorded:
+            print(f"📌 Recorded the current English source of {recorded} existing '{args.locale}' "
+                  f"translations in {relpath(STATE_PATH)}")
+        units = pending_units(args.locale, args.all)
+        with open(args.output, 'w', encoding='utf-8', newline='') as out:
+            count = export_xliff(units, out, args.locale) if fmt == 'xliff' else export_csv(units, out)
+        print(f"📤 Exported {count} units for '{args.locale}' to {args.output}")
+        return 0
+
+    print(f"📥 Importing {args.file} into '{args.locale}'...")
+    try:
+        seen, accepted, errors = import_file(args.locale, args.file, dry_run=args.dry_run)
+    except (ET.ParseError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    for error in errors[:50]:
+        print(f"   ❌ {error}")
+    if len(errors) > 50:
+        print(f"   … and {len(errors) - 50} more")
+    verb = 'Validated' if args.dry_run else 'Merged'
+    print(f"✅ {verb} {len(accepted)} of {seen} units ({len(errors)} rejected)")
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
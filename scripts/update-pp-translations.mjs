@@ -1,7 +1,9 @@
-import { readFileSync, writeFileSync } from 'fs';
+import { readCatalog, recordRollbackPoint, writeCatalog } from './catalog-store.mjs';
 
-const en = JSON.parse(readFileSync('messages/en.json', 'utf8'));
-const fr = JSON.parse(readFileSync('messages/fr.json', 'utf8'));
+recordRollbackPoint();
+
+const { catalog: en, sha1: enSha1 } = readCatalog('en');
+const { catalog: fr, sha1: frSha1 } = readCatalog('fr');
 
 // Add missing keys to investmentAdvisory.individual
 const enInd = en.investmentAdvisory.individual;
@@ -94,6 +96,6 @@ frInd.helpers = {
 enInd.continueToReview = "Continue to Review";
 frInd.continueToReview = "Continuer vers la révision";
 
-writeFileSync('messages/en.json', JSON.stringify(en, null, 2), 'utf8');
-writeFileSync('messages/fr.json', JSON.stringify(fr, null, 2), 'utf8');
+writeCatalog('en', en, enSha1);
+writeCatalog('fr', fr, frSha1);
 console.log('Done!');
@@ -1,7 +1,9 @@
-import { readFileSync, writeFileSync } from 'fs';
+import { readCatalog, recordRollbackPoint, writeCatalog } from './catalog-store.mjs';
 
-const en = JSON.parse(readFileSync('messages/en.json', 'utf8'));
-const fr = JSON.parse(readFileSync('messages/fr.json', 'utf8'));
+recordRollbackPoint();
+
+const { catalog: en, sha1: enSha1 } = readCatalog('en');
+const { catalog: fr, sha1: frSha1 } = readCatalog('fr');
 
 // --- COMMON additions ---
 Object.assign(en.common, {
@@ -378,6 +380,6 @@ fr.accountOpening.business.businessFunnel = {
   }
 };
 
-writeFileSync('messages/en.json', JSON.stringify(en, null, 2), 'utf8');
-writeFileSync('messages/fr.json', JSON.stringify(fr, null, 2), 'utf8');
+writeCatalog('en', en, enSha1);
+writeCatalog('fr', fr, frSha1);
 console.log('Done!');